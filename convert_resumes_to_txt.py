@@ -3,50 +3,7 @@ import glob
 import os
 import PyPDF2
 from typing import Optional
-
-def convert_resume_to_txt(resume_json):
-    """Convert a resume JSON object to formatted text"""
-    text = []
-    
-    # Personal Information
-    text.append(resume_json['name'].upper())
-    text.append(f"Email: {resume_json['email']}")
-    text.append(f"Phone: {resume_json['phone']}")
-    text.append(f"Location: {resume_json['location']}")
-    text.append("\n")
-    
-    # Summary
-    text.append("PROFESSIONAL SUMMARY")
-    text.append("-" * 20)
-    text.append(resume_json['summary'])
-    text.append("\n")
-    
-    # Skills
-    text.append("SKILLS")
-    text.append("-" * 20)
-    text.append(", ".join(resume_json['skills']))
-    text.append("\n")
-    
-    # Experience
-    text.append("PROFESSIONAL EXPERIENCE")
-    text.append("-" * 20)
-    for exp in resume_json['experience']:
-        text.append(f"{exp['title']} at {exp['company']}")
-        text.append(f"Duration: {exp['duration']}")
-        for desc in exp['description']:
-            text.append(f"• {desc}")
-        text.append("")
-    text.append("\n")
-    
-    # Education
-    text.append("EDUCATION")
-    text.append("-" * 20)
-    for edu in resume_json['education']:
-        text.append(f"{edu['degree']} in {edu['field']}")
-        text.append(f"{edu['university']}, {edu['year']}")
-        text.append("")
-    
-    return "\n".join(text)
+from src.preprocessing.resume_ingestion import convert_resume_to_txt
 
 def convert_all_resumes():
     # Create output directory if it doesn't exist
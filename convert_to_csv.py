@@ -1,6 +1,8 @@
 import os
+import sys
 import pandas as pd
 from typing import List, Dict, Any
+from src.preprocessing.job_catalog import JobCatalog
 
 def convert_json_to_csv(json_dir: str, output_file: str) -> None:
     all_data = []
@@ -21,9 +23,18 @@ def convert_json_to_csv(json_dir: str, output_file: str) -> None:
     else:
         print("No data found to convert")
 
+def convert_json_to_catalog(json_dir: str, db_path: str) -> None:
+    # Incremental: unchanged jobs are skipped, changed ones are updated in place
+    with JobCatalog(db_path) as catalog:
+        changed = catalog.import_json_dir(json_dir)
+        print(f"Updated {changed} jobs in {db_path} ({catalog.count()} total)")
+
 def main():
     json_dir = "data/raw/jobs"
     output_file = "data/raw/jobs/sample_jobs.csv"
+    if len(sys.argv) > 1 and sys.argv[1] == "--catalog":
+        convert_json_to_catalog(json_dir, "data/raw/jobs/jobs.db")
+        return
     convert_json_to_csv(json_dir, output_file)
 
 if __name__ == "__main__":
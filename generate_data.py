@@ -1,8 +1,10 @@
 import os
 import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from faker import Faker
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 fake = Faker()
 
@@ -30,57 +32,99 @@ JOB_TITLES = {
     "Research Scientist": ["Python", "R", "Machine Learning", "Statistics", "Research", "Data Analysis"]
 }
 
-def generate_job_description():
-    title = random.choice(list(JOB_TITLES.keys()))
+# Size and skill distributions; the defaults reproduce the original 20 job / 100 resume sample.
+# Ranges are inclusive [min, max]; "title_weights" maps job titles to relative weights (uniform if empty).
+DEFAULT_PROFILE = {
+    "title_weights": {},
+    "resume_skills": [7, 7],
+    "cross_skill_probability": 0.0,
+    "summary_sentences": 3,
+    "experience_entries": [2, 4],
+    "experience_bullets": [3, 5],
+    "education_entries": [1, 2],
+    "job_required_skills": 5,
+    "job_preferred_skills": 3,
+    "job_description_sentences": 5,
+    "responsibilities": [5, 8],
+    "requirements": [3, 6]
+}
+
+def load_profile(profile_path: Optional[str]) -> Dict[str, Any]:
+    profile = dict(DEFAULT_PROFILE)
+    if profile_path:
+        with open(profile_path, 'r') as f:
+            overrides = json.load(f)
+        unknown = set(overrides) - set(DEFAULT_PROFILE)
+        if unknown:
+            raise ValueError(f"Unknown profile keys: {', '.join(sorted(unknown))}")
+        profile.update(overrides)
+    return profile
+
+def pick_title(rng: random.Random, profile: Dict[str, Any]) -> str:
+    titles = list(JOB_TITLES.keys())
+    weights = profile.get("title_weights")
+    if not weights:
+        return rng.choice(titles)
+    return rng.choices(titles, weights=[weights.get(t, 0) for t in titles])[0]
+
+def generate_job_description(rng: random.Random = random, faker: Faker = fake, profile: Optional[Dict[str, Any]] = None):
+    profile = profile or DEFAULT_PROFILE
+    title = pick_title(rng, profile)
     skills = JOB_TITLES[title]
-    required_skills = random.sample(skills, min(5, len(skills)))
+    required_skills = rng.sample(skills, min(profile["job_required_skills"], len(skills)))
     remaining_skills = [s for s in skills if s not in required_skills]
-    preferred_skills = random.sample(remaining_skills, min(3, len(remaining_skills)))
+    preferred_skills = rng.sample(remaining_skills, min(profile["job_preferred_skills"], len(remaining_skills)))
     
     description = {
         "title": title,
-        "company": fake.company(),
-        "location": fake.city() + ", " + fake.country(),
-        "salary_range": f"${random.randint(50, 150)}k - ${random.randint(150, 250)}k",
-        "job_type": random.choice(["Full-time", "Contract", "Remote", "Hybrid"]),
-        "experience_level": random.choice(["Entry Level", "Mid Level", "Senior Level", "Lead"]),
+        "company": faker.company(),
+        "location": faker.city() + ", " + faker.country(),
+        "salary_range": f"${rng.randint(50, 150)}k - ${rng.randint(150, 250)}k",
+        "job_type": rng.choice(["Full-time", "Contract", "Remote", "Hybrid"]),
+        "experience_level": rng.choice(["Entry Level", "Mid Level", "Senior Level", "Lead"]),
         "required_skills": required_skills,
         "preferred_skills": preferred_skills,
-        "description": fake.paragraph(nb_sentences=5),
-        "responsibilities": [fake.sentence() for _ in range(random.randint(5, 8))],
-        "requirements": [fake.sentence() for _ in range(random.randint(3, 6))]
+        "description": faker.paragraph(nb_sentences=profile["job_description_sentences"]),
+        "responsibilities": [faker.sentence() for _ in range(rng.randint(*profile["responsibilities"]))],
+        "requirements": [faker.sentence() for _ in range(rng.randint(*profile["requirements"]))]
     }
     return description
 
-def generate_resume():
-    title = random.choice(list(JOB_TITLES.keys()))
+def generate_resume(rng: random.Random = random, faker: Faker = fake, profile: Optional[Dict[str, Any]] = None):
+    profile = profile or DEFAULT_PROFILE
+    title = pick_title(rng, profile)
     skills = JOB_TITLES[title]
-    candidate_skills = random.sample(skills, min(7, len(skills)))
+    candidate_skills = rng.sample(skills, min(rng.randint(*profile["resume_skills"]), len(skills)))
+    
+    # Occasionally borrow skills from another role
+    if profile["cross_skill_probability"] and rng.random() < profile["cross_skill_probability"]:
+        other_skills = [s for s in JOB_TITLES[pick_title(rng, profile)] if s not in candidate_skills]
+        candidate_skills += rng.sample(other_skills, min(2, len(other_skills)))
     
     resume = {
-        "name": fake.name(),
-        "email": fake.email(),
-        "phone": fake.phone_number(),
-        "location": fake.city() + ", " + fake.country(),
-        "summary": fake.paragraph(nb_sentences=3),
+        "name": faker.name(),
+        "email": faker.email(),
+        "phone": faker.phone_number(),
+        "location": faker.city() + ", " + faker.country(),
+        "summary": faker.paragraph(nb_sentences=profile["summary_sentences"]),
         "skills": candidate_skills,
         "experience": [
             {
-                "title": random.choice(list(JOB_TITLES.keys())),
-                "company": fake.company(),
-                "duration": f"{random.randint(1, 5)} years",
-                "description": [fake.sentence() for _ in range(random.randint(3, 5))]
+                "title": pick_title(rng, profile),
+                "company": faker.company(),
+                "duration": f"{rng.randint(1, 5)} years",
+                "description": [faker.sentence() for _ in range(rng.randint(*profile["experience_bullets"]))]
             }
-            for _ in range(random.randint(2, 4))
+            for _ in range(rng.randint(*profile["experience_entries"]))
         ],
         "education": [
             {
-                "degree": random.choice(["Bachelor's", "Master's", "PhD"]),
-                "field": random.choice(["Computer Science", "Engineering", "Data Science", "Mathematics"]),
-                "university": fake.company() + " University",
-                "year": random.randint(2010, 2023)
+                "degree": rng.choice(["Bachelor's", "Master's", "PhD"]),
+                "field": rng.choice(["Computer Science", "Engineering", "Data Science", "Mathematics"]),
+                "university": faker.company() + " University",
+                "year": rng.randint(2010, 2023)
             }
-            for _ in range(random.randint(1, 2))
+            for _ in range(rng.randint(*profile["education_entries"]))
         ]
     }
     return resume
@@ -133,7 +177,99 @@ def save_jobs(jobs: List[Dict[str, Any]], output_dir: str) -> None:
         with open(output_file, 'w') as f:
             json.dump(job, f, indent=4)
 
-def main():
+def shard_seed(seed: int, kind: str, shard_index: int) -> int:
+    # Derived only from (seed, kind, shard), so output does not depend on worker count or scheduling
+    return random.Random(f"{seed}:{kind}:{shard_index}").getrandbits(63)
+
+_shard_faker = None
+
+def generate_shard(task: Tuple[str, int, int, int, str, str, Dict[str, Any]]) -> Tuple[str, int]:
+    global _shard_faker
+    kind, shard_index, count, seed, output_dir, output_format, profile = task
+    
+    # Faker instances are expensive to build, so each worker process reuses one
+    if _shard_faker is None:
+        _shard_faker = Faker()
+    
+    worker_seed = shard_seed(seed, kind, shard_index)
+    rng = random.Random(worker_seed)
+    _shard_faker.seed_instance(worker_seed)
+    generate = generate_resume if kind == "resumes" else generate_job_description
+    records = [generate(rng, _shard_faker, profile) for _ in range(count)]
+    
+    output_file = os.path.join(output_dir, f"{kind}-{shard_index:05d}.{output_format}")
+    if output_format == "parquet":
+        import pandas as pd
+        pd.DataFrame(records).to_parquet(output_file, index=False)
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write("\n")
+    
+    return output_file, count
+
+def check_parquet_engine() -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        try:
+            import fastparquet  # noqa: F401
+        except ImportError:
+            raise ImportError("Parquet output needs pyarrow or fastparquet; install one with 'pip install pyarrow'")
+
+def shard_tasks(kind: str, total: int, shard_size: int, seed: int, output_dir: str,
+                output_format: str, profile: Dict[str, Any]) -> List[Tuple[str, int, int, int, str, str, Dict[str, Any]]]:
+    tasks = []
+    for shard_index, start in enumerate(range(0, total, shard_size)):
+        count = min(shard_size, total - start)
+        tasks.append((kind, shard_index, count, seed, output_dir, output_format, profile))
+    return tasks
+
+def generate_corpus(num_resumes: int, num_jobs: int, seed: int, output_dir: str, shard_size: int = 50000,
+                    output_format: str = "jsonl", workers: Optional[int] = None,
+                    profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    if output_format not in ("jsonl", "parquet"):
+        raise ValueError(f"Unsupported output format: {output_format}")
+    if shard_size <= 0:
+        raise ValueError(f"shard_size must be positive, got {shard_size}")
+    if num_resumes < 0 or num_jobs < 0:
+        raise ValueError(f"Record counts must not be negative, got {num_resumes} resumes and {num_jobs} jobs")
+    if output_format == "parquet":
+        # Fail before starting workers rather than inside every shard
+        check_parquet_engine()
+    
+    profile = profile or DEFAULT_PROFILE
+    os.makedirs(output_dir, exist_ok=True)
+    
+    tasks = (shard_tasks("jobs", num_jobs, shard_size, seed, output_dir, output_format, profile)
+             + shard_tasks("resumes", num_resumes, shard_size, seed, output_dir, output_format, profile))
+    
+    shards = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for output_file, count in executor.map(generate_shard, tasks):
+            shards.append({"file": os.path.basename(output_file), "records": count})
+            print(f"Wrote {count} records to {output_file}")
+    
+    manifest = {
+        "seed": seed,
+        "resumes": num_resumes,
+        "jobs": num_jobs,
+        "shard_size": shard_size,
+        "format": output_format,
+        "profile": profile,
+        "shards": shards
+    }
+    with open(os.path.join(output_dir, "manifest.json"), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    
+    return manifest
+
+def generate_sample_data(seed: Optional[int] = None):
+    if seed is not None:
+        random.seed(seed)
+        fake.seed_instance(seed)
+    
     # Create directories if they don't exist
     os.makedirs("data/raw/jobs", exist_ok=True)
     os.makedirs("data/raw/resumes", exist_ok=True)
@@ -155,5 +291,36 @@ def main():
     save_jobs(jobs, output_dir)
     print(f"Generated {len(jobs)} sample job descriptions")
 
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic jobs and resumes")
+    parser.add_argument('--seed', type=int, default=None, help="Seed for reproducible output")
+    parser.add_argument('--resumes', type=int, default=None, help="Generate a sharded corpus with this many resumes")
+    parser.add_argument('--jobs', type=int, default=0, help="Number of jobs in the sharded corpus")
+    parser.add_argument('--output-dir', default="data/generated", help="Output directory for the sharded corpus")
+    parser.add_argument('--shard-size', type=int, default=50000, help="Records per shard file")
+    parser.add_argument('--format', choices=["jsonl", "parquet"], default="jsonl", help="Shard file format")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--profile', default=None, help="JSON file overriding the size and skill distributions")
+    args = parser.parse_args()
+    
+    if args.resumes is None and not args.jobs:
+        generate_sample_data(args.seed)
+        return
+    
+    try:
+        manifest = generate_corpus(
+            num_resumes=args.resumes or 0,
+            num_jobs=args.jobs,
+            seed=args.seed if args.seed is not None else 0,
+            output_dir=args.output_dir,
+            shard_size=args.shard_size,
+            output_format=args.format,
+            workers=args.workers,
+            profile=load_profile(args.profile)
+        )
+    except (ValueError, ImportError) as e:
+        parser.error(str(e))
+    print(f"Generated {manifest['resumes']} resumes and {manifest['jobs']} jobs in {len(manifest['shards'])} shards")
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
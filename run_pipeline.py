@@ -1,30 +1,55 @@
 import os
-import subprocess
+import sys
+import argparse
+import threading
 from typing import List
 
-def run_command(command: List[str]) -> bool:
-    try:
-        subprocess.run(command, check=True)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error running command {' '.join(command)}: {e}")
-        return False
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
-def main():
-    pipeline_steps = [
-        ["python", "convert_resumes_to_txt.py"],
-        ["python", "convert_to_csv.py"],
-        ["python", "src/run_batch_analysis.py"],
-        ["python", "src/run_extended_analysis.py"]
+from src.utils.pipeline import Pipeline, Step
+
+def build_pipeline() -> Pipeline:
+    # Imported here so the models load once, in this process, for every step
+    import convert_resumes_to_txt
+    import convert_to_csv
+    import run_batch_analysis
+    import run_extended_analysis
+    from models.simplified_model import SimplifiedModel
+    from preprocessing.resume_parser import ResumeParser
+    
+    model = SimplifiedModel()
+    parser = ResumeParser()
+    # SimplifiedModel refits its vectorizer on every call, so the analysis steps take turns with it
+    model_lock = threading.Lock()
+    
+    steps: List[Step] = [
+        Step('convert_resumes_to_txt', convert_resumes_to_txt.main,
+             inputs=['data/raw/resumes/*.pdf'], outputs=['data/raw/resumes_txt']),
+        Step('convert_to_csv', convert_to_csv.main,
+             inputs=['data/raw/jobs/*.json'], outputs=['data/raw/jobs/sample_jobs.csv']),
+        Step('run_batch_analysis', lambda: run_batch_analysis.main(model, parser),
+             inputs=['data/raw/resumes_txt', 'data/raw/jobs/sample_jobs.csv'],
+             outputs=['output'], lock=model_lock),
+        Step('run_extended_analysis', lambda: run_extended_analysis.main(model, parser),
+             inputs=['data/raw/resumes_txt', 'data/raw/jobs/sample_jobs.csv'],
+             outputs=['output/extended_analysis'], lock=model_lock)
     ]
+    return Pipeline(steps)
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Run the resume analysis pipeline")
+    arg_parser.add_argument('--force', action='store_true', help="Rerun every step even if up to date")
+    args = arg_parser.parse_args()
+    
+    pipeline = build_pipeline()
+    ok = pipeline.run(force=args.force)
+    print(pipeline.report())
     
-    for step in pipeline_steps:
-        print(f"Running: {' '.join(step)}")
-        if not run_command(step):
-            print("Pipeline failed")
-            return
+    if not ok:
+        print("Pipeline failed")
+        return
     
     print("Pipeline completed successfully")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -1,10 +1,17 @@
 import os
+import argparse
+import threading
 import pandas as pd
-from typing import List, Dict
+from typing import Iterator, List, Dict, Optional, Tuple
 import json
 from pathlib import Path
 from src.models.simplified_model import SimplifiedModel
+from src.models.runtime_profile import load_runtime_profile, stage_workers
 from src.preprocessing.resume_parser import ResumeParser
+from src.preprocessing.job_catalog import JobCatalog
+from src.scoring.result_table import ResultTable
+from src.utils.staged_pipeline import Stage, StagedPipeline
+from src.utils.sampling_profiler import add_profile_arguments, run_profiled
 import re
 
 def natural_sort_key(s):
@@ -12,6 +19,9 @@ def natural_sort_key(s):
             for text in re.split('([0-9]+)', str(s))]
 
 def load_job_descriptions(csv_path: str) -> List[Dict]:
+    if csv_path.endswith('.db'):
+        return list(iter_catalog_jobs(csv_path))
+    
     df = pd.read_csv(csv_path)
     jobs = []
     for _, row in df.iterrows():
@@ -23,9 +33,20 @@ def load_job_descriptions(csv_path: str) -> List[Dict]:
         jobs.append(job)
     return jobs
 
+def iter_catalog_jobs(db_path: str, title: Optional[str] = None, skill: Optional[str] = None, chunk_size: int = 1000) -> Iterator[Dict]:
+    with JobCatalog(db_path) as catalog:
+        for job in catalog.iter_jobs(title=title, skill=skill, chunk_size=chunk_size):
+            yield {
+                'title': job['title'],
+                'description': job['description'],
+                'required_skills': job['required_skills']
+            }
+
 def analyze_resume(resume_path: str, jobs: List[Dict], model: SimplifiedModel, parser: ResumeParser) -> Dict:
     resume_text = parser.extract_text_from_pdf(resume_path)
-    
+    return analyze_resume_text(resume_text, jobs, model)
+
+def analyze_resume_text(resume_text: str, jobs: List[Dict], model: SimplifiedModel) -> Dict:
     results = {}
     for job in jobs:
         job_text = f"{job['description']} {job['required_skills']}"
@@ -77,8 +98,10 @@ def save_results(resume_name: str, results: Dict):
         f.write('\n'.join(summary))
 
 def main():
-    model = SimplifiedModel()
     parser = ResumeParser()
+    profile = load_runtime_profile()
+    workers = stage_workers(profile)
+    queue_size = int(profile.get('queue_size') or 32)
     
     jobs = load_job_descriptions('data/raw/jobs/sample_jobs.csv')
     print(f"Loaded {len(jobs)} job descriptions")
@@ -86,14 +109,63 @@ def main():
     resume_dir = Path('data/raw/resumes')
     resume_files = sorted(resume_dir.glob('*.txt'), key=natural_sort_key)
     
-    for resume_file in resume_files:
+    # Every (resume, job) score across the run, in columnar form
+    table = ResultTable(capacity=max(1, len(resume_files) * len(jobs)))
+    table_lock = threading.Lock()
+    
+    # SimplifiedModel refits its vectorizer per call, so each scorer thread gets its own
+    local = threading.local()
+    
+    def read(resume_file: Path) -> Tuple[Path, Optional[str]]:
         print(f"\nProcessing {resume_file.name}...")
+        return resume_file, parser.extract_text_from_pdf(str(resume_file))
+    
+    def score(item: Tuple[Path, Optional[str]]) -> Optional[Tuple[Path, Dict]]:
+        resume_file, resume_text = item
+        if not hasattr(local, 'model'):
+            local.model = SimplifiedModel()
+        try:
+            return resume_file, analyze_resume_text(resume_text, jobs, local.model)
+        except Exception as e:
+            print(f"Error processing {resume_file.name}: {str(e)}")
+            return None
+    
+    def write(item: Tuple[Path, Dict]) -> Optional[Path]:
+        resume_file, results = item
         try:
-            results = analyze_resume(str(resume_file), jobs, model, parser)
             save_results(resume_file.stem, results)
-            print(f"Successfully analyzed {resume_file.name}")
+            with table_lock:
+                for job_title, result in results.items():
+                    table.append(resume_file.stem, job_title, result['score'], result['similarity'],
+                                 coverage_percentage=result['coverage']['coverage_percentage'],
+                                 matched_keywords=result['coverage']['matched_keywords'],
+                                 total_keywords=result['coverage']['total_keywords'],
+                                 missing_keywords=result['missing_keywords'])
         except Exception as e:
             print(f"Error processing {resume_file.name}: {str(e)}")
+            return None
+        print(f"Successfully analyzed {resume_file.name}")
+        return resume_file
+    
+    # Reading, scoring and writing overlap through bounded queues
+    pipeline = StagedPipeline([
+        Stage('reader', read, workers=workers['reader'], queue_size=queue_size),
+        Stage('scorer', score, workers=workers['scorer'], queue_size=queue_size),
+        Stage('writer', write, workers=workers['writer'], queue_size=queue_size)
+    ])
+    pipeline.run(resume_files)
+    print(pipeline.report())
+    
+    Path('output').mkdir(exist_ok=True)
+    table.save('output/results.npz')
+    print(f"Saved {len(table)} results to output/results.npz")
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    arg_parser = argparse.ArgumentParser(description="Score resumes against job descriptions")
+    add_profile_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    
+    if args.profile:
+        run_profiled(lambda profiler: main(), args.profile, args.profile_interval / 1000, args.profile_top)
+    else:
+        main()
\ No newline at end of file
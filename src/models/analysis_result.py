@@ -0,0 +1,102 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+SIMILARITY_WEIGHT = 0.4
+COVERAGE_WEIGHT = 0.6
+
+ANALYSIS_MODES = ('full', 'score_only')
+
+
+class KeywordMatch(NamedTuple):
+    keyword: str
+    matched: bool
+    strong: bool
+    missing: bool
+    # Resume term a fuzzy match was made against (models.fuzzy_matcher); None for exact matches
+    fuzzy_term: Optional[str] = None
+    confidence: float = 1.0
+
+
+class AnalysisResult(dict):
+    """Analysis dict returned by analyze_resume.
+
+    A plain, writable, JSON-serializable dict. Score fields are always
+    present. The explanation fields (missing keywords, coverage stats,
+    suggestions) are only built in 'full' mode; 'score_only' leaves them
+    out and skips the work.
+    """
+
+    def to_dict(self) -> Dict:
+        return dict(self)
+
+
+def coverage_stats(matches: List[KeywordMatch]) -> Dict[str, float]:
+    total_keywords = len(matches)
+    matched_keywords = sum(1 for match in matches if match.matched)
+    strong_matches = sum(1 for match in matches if match.strong)
+    fuzzy_matches = sum(1 for match in matches if match.fuzzy_term is not None)
+    
+    coverage_percentage = (matched_keywords / total_keywords * 100) if total_keywords > 0 else 0
+    strong_match_percentage = (strong_matches / total_keywords * 100) if total_keywords > 0 else 0
+    
+    return {
+        'coverage_percentage': coverage_percentage,
+        'strong_match_percentage': strong_match_percentage,
+        'total_keywords': total_keywords,
+        'matched_keywords': matched_keywords,
+        'strong_matches': strong_matches,
+        'fuzzy_matches': fuzzy_matches
+    }
+
+
+def overall_score(similarity_score: float, coverage_percentage: float) -> float:
+    return (similarity_score * SIMILARITY_WEIGHT + coverage_percentage / 100 * COVERAGE_WEIGHT) * 100
+
+
+def overall_score_bounds(coverage_percentage: float, similarity_floor: float = 0.0,
+                         similarity_ceiling: float = 1.0) -> Tuple[float, float]:
+    # Range the overall score can take once coverage is known and only similarity is missing
+    return (overall_score(similarity_floor, coverage_percentage),
+            overall_score(similarity_ceiling, coverage_percentage))
+
+
+def improvement_suggestions(missing_keywords: List[str], stats: Dict[str, float]) -> List[str]:
+    suggestions = []
+    
+    if missing_keywords:
+        suggestions.append(f"Add experience with: {', '.join(missing_keywords[:5])}")
+    
+    if stats['coverage_percentage'] < 70:
+        suggestions.append("Expand your resume to better match the job requirements")
+    
+    if stats['strong_match_percentage'] < 30:
+        suggestions.append("Highlight your relevant experience more prominently")
+    
+    return suggestions
+
+
+def build_analysis(similarity_score: float, matches: List[KeywordMatch], mode: str = 'full',
+                   include_keyword_score: bool = False, extra_scores: Optional[Dict] = None) -> AnalysisResult:
+    if mode not in ANALYSIS_MODES:
+        raise ValueError(f"Unsupported analysis mode: {mode}")
+    
+    total_keywords = len(matches)
+    matched_keywords = sum(1 for match in matches if match.matched)
+    coverage_percentage = (matched_keywords / total_keywords * 100) if total_keywords > 0 else 0
+    
+    scores = {
+        'overall_score': overall_score(similarity_score, coverage_percentage),
+        'similarity_score': similarity_score
+    }
+    if include_keyword_score:
+        scores['keyword_score'] = coverage_percentage / 100
+    if extra_scores:
+        scores.update(extra_scores)
+    
+    result = AnalysisResult(scores)
+    if mode == 'full':
+        stats = coverage_stats(matches)
+        missing_keywords = [match.keyword for match in matches if match.missing]
+        result['missing_keywords'] = missing_keywords
+        result['coverage_stats'] = stats
+        result['improvement_suggestions'] = improvement_suggestions(missing_keywords, stats)
+    return result
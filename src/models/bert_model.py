@@ -1,26 +1,22 @@
 import torch
-from transformers import BertTokenizer, BertModel
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
-from typing import List, Dict, Tuple
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
+from typing import List, Dict, Tuple, Optional
 import re
+from .tokenizer import tokenize
+from .registry import shared_bert, shared_stop_words
+from .runtime_profile import load_runtime_profile, apply_torch_threads
+from .analysis_result import AnalysisResult, KeywordMatch, build_analysis, coverage_stats
 
 class BertModel:
-    def __init__(self):
-        try:
-            nltk.data.find('tokenizers/punkt')
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('punkt')
-            nltk.download('stopwords')
-        
-        self.stop_words = set(stopwords.words('english'))
-        self.tokenizer = BertTokenizer.from_pretrained('bert-base-uncased')
-        self.model = BertModel.from_pretrained('bert-base-uncased')
-        self.model.eval()
+    def __init__(self, profile: Optional[Dict] = None):
+        self.profile = profile or load_runtime_profile()
+        apply_torch_threads(self.profile)
+        self.batch_size = int(self.profile.get('batch_size') or 1)
+        
+        # Loaded once per process and shared by every BertModel (models.registry)
+        self.stop_words = shared_stop_words(self)
+        self.tokenizer, self.model = shared_bert(self)
     
     def preprocess_text(self, text: str) -> str:
         text = re.sub(r'[^a-zA-Z\s]', ' ', text)
@@ -29,7 +25,9 @@ class BertModel:
         return text
     
     def get_embeddings(self, text: str) -> np.ndarray:
-        processed_text = self.preprocess_text(text)
+        return self.get_embeddings_processed(self.preprocess_text(text))
+    
+    def get_embeddings_processed(self, processed_text: str) -> np.ndarray:
         inputs = self.tokenizer(processed_text, return_tensors="pt", padding=True, truncation=True, max_length=512)
         
         with torch.no_grad():
@@ -38,6 +36,25 @@ class BertModel:
         embeddings = outputs.last_hidden_state.mean(dim=1).numpy()
         return embeddings[0]
     
+    def get_embeddings_batch(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        batch_size = batch_size or self.batch_size
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            processed = [self.preprocess_text(text) for text in texts[start:start + batch_size]]
+            inputs = self.tokenizer(processed, return_tensors="pt", padding=True, truncation=True, max_length=512)
+            
+            with torch.no_grad():
+                outputs = self.model(**inputs)
+            
+            # Mean over real tokens only, so padding does not change a document's embedding
+            mask = inputs['attention_mask'].unsqueeze(-1).to(outputs.last_hidden_state.dtype)
+            summed = (outputs.last_hidden_state * mask).sum(dim=1)
+            batches.append((summed / mask.sum(dim=1).clamp(min=1)).numpy())
+        
+        if not batches:
+            return np.zeros((0, self.model.config.hidden_size), dtype=np.float32)
+        return np.vstack(batches)
+    
     def compute_similarity(self, text1: str, text2: str) -> float:
         embedding1 = self.get_embeddings(text1)
         embedding2 = self.get_embeddings(text2)
@@ -46,8 +63,7 @@ class BertModel:
     
     def extract_keywords(self, text: str, top_n: int = 20) -> List[Tuple[str, float]]:
         processed_text = self.preprocess_text(text)
-        tokens = word_tokenize(processed_text)
-        tokens = [token for token in tokens if token not in self.stop_words]
+        tokens = tokenize(processed_text, self.stop_words)
         
         word_freq = {}
         for token in tokens:
@@ -60,67 +76,25 @@ class BertModel:
         keyword_scores.sort(key=lambda x: x[1], reverse=True)
         return keyword_scores[:top_n]
     
-    def get_missing_keywords(self, resume_text: str, job_description: str, threshold: float = 0.1) -> List[str]:
+    def match_keywords(self, resume_text: str, job_description: str, threshold: float = 0.1) -> List[KeywordMatch]:
         job_keywords = self.extract_keywords(job_description)
         processed_resume = self.preprocess_text(resume_text)
-        resume_tokens = word_tokenize(processed_resume)
-        resume_tokens = [token for token in resume_tokens if token not in self.stop_words]
+        resume_tokens = set(tokenize(processed_resume, self.stop_words))
         
-        missing_keywords = []
+        matches = []
         for keyword, importance in job_keywords:
-            if keyword not in resume_tokens:
-                missing_keywords.append(keyword)
-        
-        return missing_keywords
+            matched = keyword in resume_tokens
+            matches.append(KeywordMatch(keyword, matched, matched and importance > 0.5, not matched))
+        return matches
+    
+    def get_missing_keywords(self, resume_text: str, job_description: str, threshold: float = 0.1) -> List[str]:
+        matches = self.match_keywords(resume_text, job_description, threshold)
+        return [match.keyword for match in matches if match.missing]
     
     def get_keyword_coverage(self, resume_text: str, job_description: str) -> Dict[str, float]:
-        job_keywords = self.extract_keywords(job_description)
-        processed_resume = self.preprocess_text(resume_text)
-        resume_tokens = word_tokenize(processed_resume)
-        resume_tokens = [token for token in resume_tokens if token not in self.stop_words]
-        
-        total_keywords = len(job_keywords)
-        matched_keywords = 0
-        strong_matches = 0
-        
-        for keyword, importance in job_keywords:
-            if keyword in resume_tokens:
-                matched_keywords += 1
-                if importance > 0.5:
-                    strong_matches += 1
-        
-        coverage_percentage = (matched_keywords / total_keywords * 100) if total_keywords > 0 else 0
-        strong_match_percentage = (strong_matches / total_keywords * 100) if total_keywords > 0 else 0
-        
-        return {
-            'coverage_percentage': coverage_percentage,
-            'strong_match_percentage': strong_match_percentage,
-            'total_keywords': total_keywords,
-            'matched_keywords': matched_keywords,
-            'strong_matches': strong_matches
-        }
+        return coverage_stats(self.match_keywords(resume_text, job_description))
     
-    def analyze_resume(self, resume_text: str, job_description: str) -> Dict:
+    def analyze_resume(self, resume_text: str, job_description: str, mode: str = 'full') -> AnalysisResult:
         similarity_score = self.compute_similarity(resume_text, job_description)
-        missing_keywords = self.get_missing_keywords(resume_text, job_description)
-        coverage_stats = self.get_keyword_coverage(resume_text, job_description)
-        overall_score = (similarity_score * 0.4 + coverage_stats['coverage_percentage'] / 100 * 0.6) * 100
-        
-        improvement_suggestions = []
-        
-        if missing_keywords:
-            improvement_suggestions.append(f"Add experience with: {', '.join(missing_keywords[:5])}")
-        
-        if coverage_stats['coverage_percentage'] < 70:
-            improvement_suggestions.append("Expand your resume to better match the job requirements")
-        
-        if coverage_stats['strong_match_percentage'] < 30:
-            improvement_suggestions.append("Highlight your relevant experience more prominently")
-        
-        return {
-            'overall_score': overall_score,
-            'similarity_score': similarity_score,
-            'missing_keywords': missing_keywords,
-            'coverage_stats': coverage_stats,
-            'improvement_suggestions': improvement_suggestions
-        } 
\ No newline at end of file
+        matches = self.match_keywords(resume_text, job_description)
+        return build_analysis(similarity_score, matches, mode)
\ No newline at end of file
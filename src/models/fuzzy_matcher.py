@@ -0,0 +1,181 @@
+import re
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+from .analysis_result import KeywordMatch
+
+DEFAULT_MAX_EDIT_DISTANCE = 2
+DEFAULT_MIN_CONFIDENCE = 0.75
+# Terms shorter than this only match exactly ("sql" vs "sq" is not a typo worth forgiving)
+DEFAULT_MIN_LENGTH = 4
+# Deletes are generated from this many leading characters only, as in SymSpell
+DEFAULT_PREFIX_LENGTH = 7
+
+
+class FuzzyMatch(NamedTuple):
+    term: str
+    distance: int
+    # 1 - distance / length of the longer word
+    confidence: float
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal string alignment distance (edits plus adjacent transpositions).
+
+    Returns max_distance + 1 as soon as the distance is known to exceed
+    max_distance.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    # Every string reachable from word by deleting up to max_distance characters
+    deletes = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {term[:i] + term[i + 1:] for term in frontier if len(term) > 1 for i in range(len(term))}
+        deletes |= frontier
+    return deletes
+
+
+class FuzzyIndex:
+    """Symmetric-delete index over a resume vocabulary.
+
+    Every vocabulary word is stored under all strings obtained by deleting
+    up to max_edit_distance characters from its prefix. A lookup generates
+    the same deletes for the query, so two words within the edit distance
+    always share a key. Only the words under those keys are compared with
+    the real edit distance. The cost of a lookup depends on the query
+    length and the edit distance, not on the size of the vocabulary.
+    """
+
+    def __init__(self, vocabulary: Iterable[str], max_edit_distance: int = DEFAULT_MAX_EDIT_DISTANCE,
+                 min_confidence: float = DEFAULT_MIN_CONFIDENCE, min_length: int = DEFAULT_MIN_LENGTH,
+                 prefix_length: int = DEFAULT_PREFIX_LENGTH):
+        if max_edit_distance < 0:
+            raise ValueError("max_edit_distance must be non-negative")
+        self.max_edit_distance = max_edit_distance
+        self.min_confidence = min_confidence
+        self.min_length = min_length
+        self.prefix_length = max(prefix_length, max_edit_distance + 1)
+        self.words: Set[str] = set()
+        self._index: Dict[str, List[str]] = {}
+        for word in vocabulary:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        if word in self.words:
+            return
+        self.words.add(word)
+        if len(word) < self.min_length:
+            return
+        for key in _deletes(word[:self.prefix_length], self.max_edit_distance):
+            self._index.setdefault(key, []).append(word)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.words
+
+    def lookup(self, term: str) -> Optional[FuzzyMatch]:
+        # Closest vocabulary word, ties broken alphabetically; None if nothing is close enough
+        if term in self.words:
+            return FuzzyMatch(term, 0, 1.0)
+        if len(term) < self.min_length or not self.max_edit_distance:
+            return None
+
+        best = None
+        seen = set()
+        for key in _deletes(term[:self.prefix_length], self.max_edit_distance):
+            for word in self._index.get(key, ()):
+                if word in seen:
+                    continue
+                seen.add(word)
+                distance = edit_distance(term, word, self.max_edit_distance)
+                if distance > self.max_edit_distance:
+                    continue
+                confidence = 1 - distance / max(len(term), len(word))
+                if confidence < self.min_confidence:
+                    continue
+                if best is None or (distance, word) < (best.distance, best.term):
+                    best = FuzzyMatch(word, distance, confidence)
+        return best
+
+    def match_keyword(self, keyword: str) -> Optional[FuzzyMatch]:
+        # Multi-word keywords match when every word does; confidence is the weakest word's
+        words = keyword.split()
+        if len(words) == 1:
+            return self.lookup(keyword)
+        found = []
+        for word in words:
+            match = self.lookup(word)
+            if match is None:
+                return None
+            found.append(match)
+        return FuzzyMatch(' '.join(match.term for match in found), sum(match.distance for match in found),
+                          min(match.confidence for match in found))
+
+
+def resume_vocabulary(resume_text: str) -> Set[str]:
+    # Same normalization as the models' preprocess_text
+    return set(re.sub(r'[^a-zA-Z\s]', ' ', resume_text).lower().split())
+
+
+class FuzzyKeywordMatcher:
+    """Turns keywords the exact matchers missed into fuzzy matches.
+
+    Indexes are built per resume and kept in a small LRU, so scoring one
+    resume against many jobs builds its index once.
+    """
+
+    def __init__(self, max_edit_distance: int = DEFAULT_MAX_EDIT_DISTANCE,
+                 min_confidence: float = DEFAULT_MIN_CONFIDENCE, min_length: int = DEFAULT_MIN_LENGTH,
+                 cache_size: int = 16):
+        self.max_edit_distance = max_edit_distance
+        self.min_confidence = min_confidence
+        self.min_length = min_length
+        self.cache_size = cache_size
+        self._indexes: 'OrderedDict[str, FuzzyIndex]' = OrderedDict()
+
+    def index(self, resume_text: str) -> FuzzyIndex:
+        index = self._indexes.get(resume_text)
+        if index is not None:
+            self._indexes.move_to_end(resume_text)
+            return index
+        index = FuzzyIndex(resume_vocabulary(resume_text), self.max_edit_distance,
+                           self.min_confidence, self.min_length)
+        self._indexes[resume_text] = index
+        if len(self._indexes) > self.cache_size:
+            self._indexes.popitem(last=False)
+        return index
+
+    def apply(self, matches: List[KeywordMatch], resume_text: str) -> List[KeywordMatch]:
+        # Exact matches are kept as they are; only unmatched or missing keywords are looked up
+        if not any(match.missing or not match.matched for match in matches):
+            return matches
+        index = self.index(resume_text)
+        result = []
+        for match in matches:
+            if match.matched and not match.missing:
+                result.append(match)
+                continue
+            found = index.match_keyword(match.keyword)
+            if found is None or not found.distance:
+                result.append(match)
+                continue
+            result.append(KeywordMatch(match.keyword, True, False, False, found.term, found.confidence))
+        return result
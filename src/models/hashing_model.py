@@ -0,0 +1,130 @@
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.utils import murmurhash3_32
+from sklearn.metrics.pairwise import cosine_similarity
+from scipy.sparse import csr_matrix
+import numpy as np
+from typing import List, Dict, Iterable, Optional, Tuple
+import re
+from .analysis_result import AnalysisResult, KeywordMatch, build_analysis, coverage_stats
+
+class HashingModel:
+    """TF-IDF-style scoring on hashed features.
+
+    The feature space is fixed by n_features, so any process can vectorize any
+    shard without a shared vocabulary. Corpus IDF is optional: each shard
+    reports its document-frequency array, the arrays are summed, and the
+    result is installed with set_document_frequencies.
+    """
+
+    def __init__(self, n_features: int = 2 ** 20, alternate_sign: bool = True):
+        self.n_features = n_features
+        self.alternate_sign = alternate_sign
+        self.vectorizer = HashingVectorizer(
+            stop_words='english',
+            ngram_range=(1, 2),
+            n_features=n_features,
+            alternate_sign=alternate_sign,
+            norm=None
+        )
+        self.analyzer = self.vectorizer.build_analyzer()
+        self.idf: Optional[np.ndarray] = None
+    
+    def preprocess_text(self, text: str) -> str:
+        text = re.sub(r'[^a-zA-Z\s]', ' ', text)
+        text = text.lower()
+        text = ' '.join(text.split())
+        return text
+    
+    def feature_index(self, term: str) -> int:
+        # Same bucket HashingVectorizer assigns to the term
+        h = murmurhash3_32(term, seed=0)
+        if h == -2 ** 31:
+            return (2 ** 31 - 1 - (self.n_features - 1)) % self.n_features
+        return abs(h) % self.n_features
+    
+    def document_frequencies(self, texts: Iterable[str]) -> Tuple[np.ndarray, int]:
+        """Per-shard DF array and document count; shards are merged by summing"""
+        return self.count_document_frequencies(self.count(texts))
+    
+    @staticmethod
+    def count_document_frequencies(counts: csr_matrix) -> Tuple[np.ndarray, int]:
+        matrix = counts.copy()
+        matrix.data = np.ones_like(matrix.data)
+        df = np.asarray(matrix.sum(axis=0)).ravel().astype(np.int64)
+        return df, matrix.shape[0]
+    
+    @staticmethod
+    def merge_document_frequencies(shards: Iterable[Tuple[np.ndarray, int]]) -> Tuple[np.ndarray, int]:
+        total_df = None
+        total_docs = 0
+        for df, n_docs in shards:
+            total_df = df.copy() if total_df is None else total_df + df
+            total_docs += n_docs
+        return total_df, total_docs
+    
+    def set_document_frequencies(self, df: np.ndarray, n_docs: int) -> None:
+        if len(df) != self.n_features:
+            raise ValueError(f"DF array has {len(df)} features, expected {self.n_features}")
+        self.idf = np.log((1 + n_docs) / (1 + df.astype(np.float64))) + 1
+    
+    def count(self, texts: Iterable[str]) -> csr_matrix:
+        return self.vectorizer.transform(self.preprocess_text(text) for text in texts).tocsr()
+    
+    def transform(self, texts: Iterable[str]) -> csr_matrix:
+        return self.weight(self.count(texts))
+    
+    def weight(self, counts: csr_matrix) -> csr_matrix:
+        # Applies the current IDF and L2 norm to a raw hashed count matrix
+        matrix = counts.astype(np.float64)
+        if self.idf is not None:
+            matrix.data *= self.idf[matrix.indices]
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        return csr_matrix(matrix.multiply(1 / norms[:, None]))
+    
+    def extract_keywords(self, text: str, top_n: int = 20) -> List[Tuple[str, float]]:
+        terms = self.analyzer(self.preprocess_text(text))
+        counts: Dict[str, int] = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        
+        scores = {}
+        for term, count in counts.items():
+            weight = float(count)
+            if self.idf is not None:
+                weight *= self.idf[self.feature_index(term)]
+            scores[term] = weight
+        
+        norm = np.sqrt(sum(w * w for w in scores.values())) or 1.0
+        keyword_scores = [(term, weight / norm) for term, weight in scores.items()]
+        keyword_scores.sort(key=lambda x: x[1], reverse=True)
+        return keyword_scores[:top_n]
+    
+    def compute_similarity(self, text1: str, text2: str) -> float:
+        matrix = self.transform([text1, text2])
+        similarity = cosine_similarity(matrix[0:1], matrix[1:2])[0][0]
+        return float(similarity)
+    
+    def _resume_weights(self, resume_text: str) -> csr_matrix:
+        return self.transform([resume_text])
+    
+    def match_keywords(self, resume_text: str, job_description: str, threshold: float = 0.1) -> List[KeywordMatch]:
+        job_keywords = self.extract_keywords(job_description)
+        resume_vector = self._resume_weights(resume_text)
+        matches = []
+        for keyword, importance in job_keywords:
+            score = abs(resume_vector[0, self.feature_index(keyword)])
+            matches.append(KeywordMatch(keyword, score > 0, score > 0.5, score < threshold))
+        return matches
+    
+    def get_missing_keywords(self, resume_text: str, job_description: str, threshold: float = 0.1) -> List[str]:
+        matches = self.match_keywords(resume_text, job_description, threshold)
+        return [match.keyword for match in matches if match.missing]
+    
+    def get_keyword_coverage(self, resume_text: str, job_description: str) -> Dict[str, float]:
+        return coverage_stats(self.match_keywords(resume_text, job_description))
+    
+    def analyze_resume(self, resume_text: str, job_description: str, mode: str = 'full') -> AnalysisResult:
+        similarity_score = self.compute_similarity(resume_text, job_description)
+        matches = self.match_keywords(resume_text, job_description)
+        return build_analysis(similarity_score, matches, mode)
@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import numpy as np
+from .tfidf_model import TfidfModel
+from .bert_model import BertModel
+from .analysis_result import AnalysisResult, KeywordMatch, build_analysis, coverage_stats
+
+
+class HybridModel:
+    """Fuses TF-IDF (sparse) and BERT (dense) similarity over one shared ingestion.
+
+    Each document is cleaned once into the normalized text both models use,
+    and that prepared form feeds the TF-IDF path, the BERT tokenizer and the
+    keyword matching. Only the cleaning is shared: TF-IDF still fits its
+    vectorizer on each pair and BERT runs its own WordPiece tokenizer.
+    Prepared texts and embeddings are kept in small LRU caches, so a resume
+    scored against many jobs is prepared and embedded once. BERT is loaded
+    on first use, so bert_weight=0 never loads it.
+    """
+
+    def __init__(self, tfidf_weight: float = 0.5, bert_weight: float = 0.5,
+                 cache_size: int = 1024, profile: Optional[Dict] = None):
+        if tfidf_weight < 0 or bert_weight < 0 or tfidf_weight + bert_weight <= 0:
+            raise ValueError("Hybrid weights must be non-negative and not both zero")
+        
+        total = tfidf_weight + bert_weight
+        self.tfidf_weight = tfidf_weight / total
+        self.bert_weight = bert_weight / total
+        self.cache_size = cache_size
+        
+        self.profile = profile
+        self.tfidf = TfidfModel()
+        self._bert: Optional[BertModel] = None
+        self._prepared: 'OrderedDict[str, str]' = OrderedDict()
+        self._embeddings: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+    
+    @property
+    def bert(self) -> BertModel:
+        if self._bert is None:
+            self._bert = BertModel(self.profile)
+        return self._bert
+    
+    def _remember(self, cache: OrderedDict, key, value):
+        cache[key] = value
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return value
+    
+    def prepare(self, text: str) -> str:
+        prepared = self._prepared.get(text)
+        if prepared is not None:
+            self._prepared.move_to_end(text)
+            return prepared
+        return self._remember(self._prepared, text, self.tfidf.preprocess_text(text))
+    
+    def embedding(self, prepared_text: str) -> np.ndarray:
+        embedding = self._embeddings.get(prepared_text)
+        if embedding is not None:
+            self._embeddings.move_to_end(prepared_text)
+            return embedding
+        return self._remember(self._embeddings, prepared_text,
+                              self.bert.get_embeddings_processed(prepared_text))
+    
+    def similarity_components(self, text1: str, text2: str) -> Dict[str, float]:
+        prepared1 = self.prepare(text1)
+        prepared2 = self.prepare(text2)
+        
+        tfidf_similarity = self.tfidf.compute_similarity_processed(prepared1, prepared2) if self.tfidf_weight else 0.0
+        if self.bert_weight:
+            embedding1 = self.embedding(prepared1)
+            embedding2 = self.embedding(prepared2)
+            norm = np.linalg.norm(embedding1) * np.linalg.norm(embedding2)
+            bert_similarity = float(np.dot(embedding1, embedding2) / norm) if norm else 0.0
+        else:
+            bert_similarity = 0.0
+        
+        return {
+            'similarity_score': self.tfidf_weight * tfidf_similarity + self.bert_weight * bert_similarity,
+            'tfidf_similarity': tfidf_similarity,
+            'bert_similarity': bert_similarity
+        }
+    
+    def compute_similarity(self, text1: str, text2: str) -> float:
+        return self.similarity_components(text1, text2)['similarity_score']
+    
+    def match_keywords(self, resume_text: str, job_description: str, threshold: float = 0.1) -> List[KeywordMatch]:
+        return self.tfidf.match_keywords_processed(self.prepare(resume_text), self.prepare(job_description), threshold)
+    
+    def get_missing_keywords(self, resume_text: str, job_description: str, threshold: float = 0.1) -> List[str]:
+        matches = self.match_keywords(resume_text, job_description, threshold)
+        return [match.keyword for match in matches if match.missing]
+    
+    def get_keyword_coverage(self, resume_text: str, job_description: str) -> Dict[str, float]:
+        return coverage_stats(self.match_keywords(resume_text, job_description))
+    
+    def analyze_resume(self, resume_text: str, job_description: str, mode: str = 'full',
+                       include_keyword_score: bool = False) -> AnalysisResult:
+        components = self.similarity_components(resume_text, job_description)
+        similarity_score = components.pop('similarity_score')
+        matches = self.match_keywords(resume_text, job_description)
+        return build_analysis(similarity_score, matches, mode, include_keyword_score, extra_scores=components)
@@ -0,0 +1,123 @@
+import re
+from typing import Dict, Hashable, List, Optional, Tuple
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+
+class IncrementalTfidfVectorizer:
+    """TF-IDF over a corpus that changes one document at a time.
+
+    Document frequencies and the vocabulary are updated in O(document) on
+    add/remove. IDF weights are recomputed lazily, only when a vector is
+    requested after the corpus changed. Each stored document keeps its raw
+    term counts, so its weighted vector can be rebuilt for the current IDF
+    without re-tokenizing. Weighting matches TfidfVectorizer defaults
+    (smooth idf, L2 norm).
+    """
+
+    token_pattern = re.compile(r"(?u)\b\w\w+\b")
+
+    def __init__(self, ngram_range: Tuple[int, int] = (1, 2), stop_words=ENGLISH_STOP_WORDS):
+        self.ngram_range = ngram_range
+        self.stop_words = frozenset(stop_words or ())
+        self.vocabulary_: Dict[str, int] = {}
+        self.n_docs = 0
+        self.version = 0
+        self._df: List[int] = []
+        self._counts: Dict[Hashable, Tuple[np.ndarray, np.ndarray]] = {}
+        self._vectors: Dict[Hashable, Tuple[int, csr_matrix]] = {}
+        self._idf: Optional[np.ndarray] = None
+        self._idf_version = -1
+
+    def analyze(self, text: str) -> List[str]:
+        tokens = [t for t in self.token_pattern.findall(text.lower()) if t not in self.stop_words]
+        min_n, max_n = self.ngram_range
+        terms = tokens if min_n == 1 else []
+        for n in range(max(min_n, 2), max_n + 1):
+            terms.extend(' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return terms
+
+    def _count(self, text: str, grow: bool) -> Tuple[np.ndarray, np.ndarray]:
+        counts: Dict[int, int] = {}
+        for term in self.analyze(text):
+            idx = self.vocabulary_.get(term)
+            if idx is None:
+                if not grow:
+                    continue
+                idx = len(self.vocabulary_)
+                self.vocabulary_[term] = idx
+                self._df.append(0)
+            counts[idx] = counts.get(idx, 0) + 1
+        indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        return indices, values
+
+    def add_document(self, doc_id: Hashable, text: str) -> None:
+        if doc_id in self._counts:
+            self.remove_document(doc_id)
+        indices, values = self._count(text, grow=True)
+        for idx in indices:
+            self._df[idx] += 1
+        self._counts[doc_id] = (indices, values)
+        self.n_docs += 1
+        self.version += 1
+
+    def remove_document(self, doc_id: Hashable) -> None:
+        indices, _ = self._counts.pop(doc_id)
+        self._vectors.pop(doc_id, None)
+        for idx in indices:
+            self._df[idx] -= 1
+        self.n_docs -= 1
+        self.version += 1
+
+    def count(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        # Raw (vocabulary index, count) pairs; terms outside the vocabulary are dropped
+        return self._count(text, grow=False)
+
+    def term_counts(self, doc_id: Hashable) -> Tuple[np.ndarray, np.ndarray]:
+        return self._counts[doc_id]
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._counts
+
+    def __len__(self) -> int:
+        return self.n_docs
+
+    @property
+    def idf_(self) -> np.ndarray:
+        if self._idf_version != self.version:
+            df = np.asarray(self._df, dtype=np.float64)
+            self._idf = np.log((1 + self.n_docs) / (1 + df)) + 1
+            self._idf_version = self.version
+        return self._idf
+
+    def _weight(self, indices: np.ndarray, values: np.ndarray) -> csr_matrix:
+        weights = values * self.idf_[indices]
+        norm = np.linalg.norm(weights)
+        if norm > 0:
+            weights = weights / norm
+        rows = np.zeros(len(indices), dtype=np.int64)
+        return csr_matrix((weights, (rows, indices)), shape=(1, len(self.vocabulary_)))
+
+    def vector(self, doc_id: Hashable) -> csr_matrix:
+        cached = self._vectors.get(doc_id)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        vector = self._weight(*self._counts[doc_id])
+        self._vectors[doc_id] = (self.version, vector)
+        return vector
+
+    def transform(self, text: str) -> csr_matrix:
+        # Terms outside the corpus vocabulary are ignored, as with a fitted TfidfVectorizer
+        return self._weight(*self._count(text, grow=False))
+
+    @staticmethod
+    def cosine(vector1: csr_matrix, vector2: csr_matrix) -> float:
+        # Vectors are L2-normalized; pad to a common width in case the vocabulary grew in between
+        width = max(vector1.shape[1], vector2.shape[1])
+        if vector1.shape[1] != width:
+            vector1 = csr_matrix((vector1.data, vector1.indices, vector1.indptr), shape=(1, width))
+        if vector2.shape[1] != width:
+            vector2 = csr_matrix((vector2.data, vector2.indices, vector2.indptr), shape=(1, width))
+        return float(vector1.multiply(vector2).sum())
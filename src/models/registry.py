@@ -0,0 +1,147 @@
+import threading
+import time
+import weakref
+from typing import Callable, Dict, FrozenSet, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+DEFAULT_IDLE_TIMEOUT = 300.0
+BERT_MODEL_NAME = 'bert-base-uncased'
+
+
+class _Entry:
+    __slots__ = ('value', 'loaded', 'refs', 'last_released', 'lock')
+
+    def __init__(self):
+        self.value = None
+        self.loaded = False
+        self.refs = 0
+        self.last_released = 0.0
+        self.lock = threading.Lock()
+
+
+class ModelRegistry:
+    """Process-wide cache of shared, read-only model backends.
+
+    Backends (stop-word sets, tokenizers, transformer weights) are keyed by
+    their configuration and built once by the factory passed to acquire().
+    Every acquire() takes a reference and every release() drops one. A
+    backend with no references stays cached for idle_timeout seconds so
+    short-lived owners reuse it, and is evicted on the next acquire/release
+    or evict_idle() after that. Two threads asking for the same key build it
+    once; different keys build in parallel.
+
+    Callers must not mutate what they get back; anything per-owner belongs
+    on the owner.
+    """
+
+    def __init__(self, idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT):
+        # None keeps unreferenced backends until clear(); 0 drops them on the last release
+        self.idle_timeout = idle_timeout
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'loads': 0, 'evictions': 0}
+
+    def acquire(self, key: Hashable, factory: Callable[[], T]) -> T:
+        with self._lock:
+            self._evict_idle(time.monotonic())
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+            entry.refs += 1
+
+        try:
+            with entry.lock:
+                if entry.loaded:
+                    self.stats['hits'] += 1
+                else:
+                    entry.value = factory()
+                    entry.loaded = True
+                    self.stats['loads'] += 1
+        except Exception:
+            self.release(key)
+            raise
+        return entry.value
+
+    def acquire_for(self, owner: object, key: Hashable, factory: Callable[[], T]) -> T:
+        # The reference is released when owner is garbage collected
+        value = self.acquire(key, factory)
+        weakref.finalize(owner, self.release, key)
+        return value
+
+    def release(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refs <= 0:
+                return
+            entry.refs -= 1
+            now = time.monotonic()
+            if not entry.refs:
+                entry.last_released = now
+            self._evict_idle(now)
+
+    def _evict_idle(self, now: float, idle_timeout: Optional[float] = None) -> int:
+        timeout = self.idle_timeout if idle_timeout is None else idle_timeout
+        if timeout is None:
+            return 0
+        idle = [key for key, entry in self._entries.items()
+                if not entry.refs and now - entry.last_released >= timeout]
+        for key in idle:
+            del self._entries[key]
+        self.stats['evictions'] += len(idle)
+        return len(idle)
+
+    def evict_idle(self, idle_timeout: Optional[float] = None) -> int:
+        with self._lock:
+            return self._evict_idle(time.monotonic(), idle_timeout)
+
+    def clear(self) -> None:
+        # Drops every cached backend; owners that still hold one keep using it
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def report(self) -> Dict[Hashable, Dict[str, float]]:
+        now = time.monotonic()
+        with self._lock:
+            return {key: {'refs': entry.refs, 'idle_seconds': 0.0 if entry.refs else now - entry.last_released}
+                    for key, entry in self._entries.items()}
+
+
+registry = ModelRegistry()
+
+
+def load_stop_words(language: str = 'english') -> FrozenSet[str]:
+    import nltk
+    from nltk.corpus import stopwords
+
+    try:
+        nltk.data.find('tokenizers/punkt')
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('punkt')
+        nltk.download('stopwords')
+    return frozenset(stopwords.words(language))
+
+
+def shared_stop_words(owner: object, language: str = 'english') -> FrozenSet[str]:
+    return registry.acquire_for(owner, ('stop_words', language), lambda: load_stop_words(language))
+
+
+def load_bert(name: str = BERT_MODEL_NAME) -> Tuple[object, object]:
+    from transformers import BertTokenizer, BertModel
+
+    tokenizer = BertTokenizer.from_pretrained(name)
+    model = BertModel.from_pretrained(name)
+    model.eval()
+    return tokenizer, model
+
+
+def shared_bert(owner: object, name: str = BERT_MODEL_NAME) -> Tuple[object, object]:
+    # (tokenizer, model); inference runs under torch.no_grad(), so the weights are never written
+    return registry.acquire_for(owner, ('bert', name), lambda: load_bert(name))
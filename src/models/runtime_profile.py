@@ -0,0 +1,60 @@
+import json
+import os
+from typing import Dict, Optional
+
+# Written by `python -m src.utils.autotune`; override the location with RESUME_ATS_PROFILE
+DEFAULT_PROFILE_PATH = os.path.join(os.path.expanduser('~'), '.resume_ats', 'runtime_profile.json')
+
+DEFAULT_RUNTIME_PROFILE = {
+    'intra_op_threads': None,
+    'inter_op_threads': None,
+    'batch_size': 8,
+    'workers': 1,
+    # Threads per stage of the staged batch pipeline (utils.staged_pipeline)
+    'stage_workers': {'reader': 2, 'scorer': 1, 'writer': 2},
+    'queue_size': 32
+}
+
+def profile_path() -> str:
+    return os.environ.get('RESUME_ATS_PROFILE', DEFAULT_PROFILE_PATH)
+
+def load_runtime_profile(path: Optional[str] = None) -> Dict:
+    profile = dict(DEFAULT_RUNTIME_PROFILE)
+    path = path or profile_path()
+    if not os.path.exists(path):
+        return profile
+    try:
+        with open(path, 'r') as f:
+            saved = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable runtime profile {path}: {e}")
+        return profile
+    profile.update({key: saved[key] for key in DEFAULT_RUNTIME_PROFILE if key in saved})
+    return profile
+
+def stage_workers(profile: Dict) -> Dict[str, int]:
+    # A saved profile may set only some stages; the rest keep their defaults
+    workers = dict(DEFAULT_RUNTIME_PROFILE['stage_workers'])
+    workers.update(profile.get('stage_workers') or {})
+    return {stage: max(1, int(count)) for stage, count in workers.items()}
+
+def save_runtime_profile(profile: Dict, path: Optional[str] = None) -> str:
+    path = path or profile_path()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(profile, f, indent=2)
+    return path
+
+def apply_torch_threads(profile: Dict) -> None:
+    import torch
+    
+    if profile.get('intra_op_threads'):
+        torch.set_num_threads(int(profile['intra_op_threads']))
+    if profile.get('inter_op_threads'):
+        try:
+            torch.set_num_interop_threads(int(profile['inter_op_threads']))
+        except RuntimeError:
+            # Can only be set once, before any inter-op parallel work has started
+            pass
@@ -0,0 +1,117 @@
+import argparse
+import glob
+import random
+import re
+import sys
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+# Text that preprocess_text() has already reduced to lowercase letters and whitespace
+_PREPROCESSED = re.compile(r'[a-z\s]*\Z')
+
+# Treebank splits these even without an apostrophe (nltk MacIntyreContractions.CONTRACTIONS2)
+_CONTRACTIONS = {
+    'cannot': ('can', 'not'),
+    'gimme': ('gim', 'me'),
+    'gonna': ('gon', 'na'),
+    'gotta': ('got', 'ta'),
+    'lemme': ('lem', 'me'),
+    'wanna': ('wan', 'na')
+}
+
+
+def _split(text: str) -> List[str]:
+    tokens = text.split()
+    if _CONTRACTIONS.keys().isdisjoint(tokens):
+        return tokens
+
+    split = []
+    for token in tokens:
+        split.extend(_CONTRACTIONS.get(token, (token,)))
+    return split
+
+
+def word_tokens(text: str) -> List[str]:
+    """Same tokens as nltk.word_tokenize, without Punkt for preprocessed text.
+
+    On lowercase letters and whitespace, word_tokenize only splits on
+    whitespace plus a few fixed contractions. Any other input goes to
+    word_tokenize itself.
+    """
+    if _PREPROCESSED.match(text):
+        return _split(text)
+    from nltk.tokenize import word_tokenize
+    return word_tokenize(text)
+
+
+def ngrams(tokens: List[str], ngram_range: Tuple[int, int]) -> List[str]:
+    min_n, max_n = ngram_range
+    terms = list(tokens) if min_n == 1 else []
+    for n in range(max(min_n, 2), max_n + 1):
+        terms.extend(' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+    return terms
+
+
+def tokenize(text: str, stop_words: Optional[FrozenSet[str]] = None,
+             ngram_range: Tuple[int, int] = (1, 1)) -> List[str]:
+    tokens = word_tokens(text)
+    if stop_words:
+        tokens = [token for token in tokens if token not in stop_words]
+    return tokens if ngram_range == (1, 1) else ngrams(tokens, ngram_range)
+
+
+def tokenize_batch(texts: Iterable[str], stop_words: Optional[FrozenSet[str]] = None,
+                   ngram_range: Tuple[int, int] = (1, 1)) -> List[List[str]]:
+    return [tokenize(text, stop_words, ngram_range) for text in texts]
+
+
+def check_parity(texts: Iterable[str]) -> List[Tuple[str, List[str], List[str]]]:
+    # (text, fast tokens, word_tokenize tokens) for every text where the two disagree
+    from nltk.tokenize import word_tokenize
+    mismatches = []
+    for text in texts:
+        fast, reference = word_tokens(text), word_tokenize(text)
+        if fast != reference:
+            mismatches.append((text, fast, reference))
+    return mismatches
+
+
+def parity_texts(paths: Iterable[str], n_random: int = 5000, seed: int = 0) -> List[str]:
+    """Preprocessed texts to compare: the given files plus random texts over their vocabulary.
+
+    Texts are reduced to lowercase letters and whitespace the way
+    preprocess_text() does, and the random ones mix in the six contractions
+    word_tokenize splits at random positions, including the start and end.
+    """
+    # Listed separately from _CONTRACTIONS so a word dropped there still gets checked
+    contractions = ['cannot', 'gimme', 'gonna', 'gotta', 'lemme', 'wanna']
+    texts = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            texts.append(' '.join(re.sub(r'[^a-zA-Z\s]', ' ', f.read()).lower().split()))
+
+    vocabulary = sorted({token for text in texts for token in text.split()}) or ['resume', 'python', 'team']
+    vocabulary += contractions * max(1, len(vocabulary) // 50)
+    rng = random.Random(seed)
+    texts.extend(contractions)
+    for _ in range(n_random):
+        texts.append(' '.join(rng.choice(vocabulary) for _ in range(rng.randint(1, 40))))
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the split fast path against nltk.word_tokenize")
+    parser.add_argument('--source', default='data/raw/resumes/*.txt', help="Glob of text files to preprocess")
+    parser.add_argument('--random', type=int, default=5000, help="Random texts over the same vocabulary")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    texts = parity_texts(sorted(glob.glob(args.source)), args.random, args.seed)
+    mismatches = check_parity(texts)
+    for text, fast, reference in mismatches[:10]:
+        print(f"Mismatch on {text[:80]!r}:\n  fast:          {fast[:20]}\n  word_tokenize: {reference[:20]}")
+    print(f"{len(texts) - len(mismatches)}/{len(texts)} texts tokenize identically")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
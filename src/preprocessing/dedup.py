@@ -0,0 +1,136 @@
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+import numpy as np
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+_LOW_29 = np.uint64((1 << 29) - 1)
+_LOW_32 = np.uint64((1 << 32) - 1)
+
+
+def _mod_mersenne(x: np.ndarray) -> np.ndarray:
+    # x mod 2^61 - 1 for any uint64 x, using 2^61 = 1 (mod p)
+    x = (x & MERSENNE_PRIME) + (x >> np.uint64(61))
+    return np.where(x >= MERSENNE_PRIME, x - MERSENNE_PRIME, x)
+
+
+def universal_hash(values: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """(a * value + b) mod 2^61 - 1 for 32-bit values and a, b < 2^61, without uint64 overflow.
+
+    Returns a (len(values), len(a)) array.
+    """
+    values = values[:, None]
+    a_high, a_low = a >> np.uint64(32), a & _LOW_32
+    # a_high * value < 2^61; shifting it by 32 bits is folded with 2^61 = 1 (mod p)
+    high = a_high * values
+    high = (high >> np.uint64(29)) + ((high & _LOW_29) << np.uint64(32))
+    low = _mod_mersenne(a_low * values)
+    return _mod_mersenne(_mod_mersenne(high) + low + b)
+
+
+def shingles(text: str, size: int = 3) -> Set[int]:
+    """Hashed word n-gram shingles of the letters-only, lowercased text"""
+    tokens = re.sub(r'[^a-zA-Z\s]', ' ', text).lower().split()
+    if len(tokens) < size:
+        return {zlib.crc32(' '.join(tokens).encode('utf-8'))} if tokens else set()
+    return {zlib.crc32(' '.join(tokens[i:i + size]).encode('utf-8')) for i in range(len(tokens) - size + 1)}
+
+
+def lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    # (bands, rows) whose S-curve midpoint (1/b)^(1/r) lands closest to the threshold
+    best = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class NearDuplicateIndex:
+    """MinHash signatures with LSH banding to cluster near-identical documents.
+
+    A document joins the cluster of the most similar existing representative
+    whose estimated Jaccard similarity (over word shingles) is at least
+    `threshold`; otherwise it becomes a new representative. Only
+    representatives are indexed, so clusters are never chained through
+    their members and every document is within the threshold of its
+    representative. Only representatives need to be scored.
+    """
+
+    def __init__(self, threshold: float = 0.9, num_perm: int = 128, shingle_size: int = 3, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [defaultdict(list) for _ in range(self.bands)]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+        self._representative: Dict[Hashable, Hashable] = {}
+        self._order: Dict[Hashable, int] = {}
+        self.comparisons = 0
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = np.fromiter(shingles(text, self.shingle_size), dtype=np.uint64)
+        if len(hashes) == 0:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+        permuted = universal_hash(hashes, self._a, self._b) & MAX_HASH
+        return permuted.min(axis=0)
+
+    def add(self, doc_id: Hashable, text: str) -> Hashable:
+        """Index a document and return the representative of its cluster"""
+        signature = self.signature(text)
+        self._signatures[doc_id] = signature
+        keys = [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+        
+        candidates = set()
+        for band, key in enumerate(keys):
+            candidates.update(self._buckets[band].get(key, ()))
+        
+        # Earliest representative wins ties, so the result does not depend on set order
+        best, best_similarity = None, -1.0
+        for _, other in sorted((self._order[other], other) for other in candidates):
+            self.comparisons += 1
+            similarity = self.similarity(doc_id, other)
+            if similarity >= self.threshold and similarity > best_similarity:
+                best, best_similarity = other, similarity
+        
+        if best is None:
+            best = doc_id
+            for band, key in enumerate(keys):
+                self._buckets[band][key].append(doc_id)
+        self._order.setdefault(doc_id, len(self._order))
+        self._representative[doc_id] = best
+        return best
+
+    def similarity(self, a: Hashable, b: Hashable) -> float:
+        return float(np.mean(self._signatures[a] == self._signatures[b]))
+
+    def representative(self, doc_id: Hashable) -> Hashable:
+        return self._representative[doc_id]
+
+    def clusters(self) -> List[List[Hashable]]:
+        groups: Dict[Hashable, List[Hashable]] = defaultdict(list)
+        for doc_id, representative in self._representative.items():
+            groups[representative].append(doc_id)
+        return list(groups.values())
+
+
+def deduplicate(documents: Iterable[Tuple[Hashable, str]], threshold: float = 0.9,
+                num_perm: int = 128) -> Tuple[List[Tuple[Hashable, str]], Dict[Hashable, Hashable]]:
+    """Split documents into cluster representatives and a doc_id -> representative map"""
+    index = NearDuplicateIndex(threshold=threshold, num_perm=num_perm)
+    texts = {}
+    for doc_id, text in documents:
+        index.add(doc_id, text)
+        texts[doc_id] = text
+    
+    representatives = {doc_id: index.representative(doc_id) for doc_id in texts}
+    unique = [(doc_id, texts[doc_id]) for doc_id in texts if representatives[doc_id] == doc_id]
+    return unique, representatives
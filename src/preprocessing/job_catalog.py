@@ -0,0 +1,235 @@
+import ast
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import zlib
+from collections import Counter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_key TEXT NOT NULL UNIQUE,
+    title TEXT,
+    description TEXT,
+    content_hash TEXT NOT NULL,
+    data TEXT NOT NULL,
+    features BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_title ON jobs (title);
+CREATE INDEX IF NOT EXISTS idx_jobs_content_hash ON jobs (content_hash);
+CREATE TABLE IF NOT EXISTS job_skills (
+    job_id INTEGER NOT NULL REFERENCES jobs (id) ON DELETE CASCADE,
+    skill TEXT NOT NULL,
+    PRIMARY KEY (job_id, skill)
+);
+CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills (skill);
+"""
+
+def parse_skill_list(value) -> List[str]:
+    # CSV exports store skill lists as their Python repr
+    if isinstance(value, str):
+        value = value.strip()
+        if value.startswith('['):
+            try:
+                value = ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                value = value.strip('[]').split(',')
+        else:
+            value = value.split(',')
+    if not isinstance(value, (list, tuple)):
+        return []
+    return [str(skill).strip().strip('\'"') for skill in value if str(skill).strip()]
+
+def job_features(job: Dict) -> bytes:
+    """Default per-job feature blob: the cleaned text and its term counts, zlib-compressed JSON"""
+    text = f"{job.get('description', '')} {' '.join(job.get('required_skills', []))}"
+    text = re.sub(r'[^a-zA-Z\s]', ' ', text).lower()
+    text = ' '.join(text.split())
+    features = {
+        'processed_text': text,
+        'term_counts': Counter(text.split()).most_common()
+    }
+    return zlib.compress(json.dumps(features).encode('utf-8'))
+
+def external_id(job: Dict) -> Optional[str]:
+    # CSV rows without an id come back as NaN, and integer ids as floats when the column has gaps
+    import pandas as pd
+    
+    value = job.get('id')
+    if value is None or (not isinstance(value, (list, dict)) and pd.isna(value)) or value == '':
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+def load_features(blob: Optional[bytes]) -> Optional[Dict]:
+    if blob is None:
+        return None
+    return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+class JobCatalog:
+    def __init__(self, db_path: str, feature_fn: Callable[[Dict], bytes] = job_features):
+        self.db_path = db_path
+        self.feature_fn = feature_fn
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+    
+    def close(self) -> None:
+        self.conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    @staticmethod
+    def normalize_job(job: Dict) -> Dict:
+        job = dict(job)
+        if 'title' not in job and 'job_title' in job:
+            job['title'] = job.pop('job_title')
+        job['required_skills'] = parse_skill_list(job.get('required_skills'))
+        job['preferred_skills'] = parse_skill_list(job.get('preferred_skills'))
+        return job
+    
+    @staticmethod
+    def content_hash(job: Dict) -> str:
+        return hashlib.sha256(json.dumps(job, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    
+    def _upsert(self, job: Dict, source_key: Optional[str] = None) -> bool:
+        # Jobs are keyed by their id; id-less jobs by where they came from (file and
+        # position), so editing one replaces its row. The content hash is the last resort.
+        job = self.normalize_job(job)
+        content_hash = self.content_hash(job)
+        job_key = external_id(job) or source_key or content_hash
+        
+        row = self.conn.execute("SELECT id, content_hash FROM jobs WHERE job_key = ?", (job_key,)).fetchone()
+        if row is not None and row[1] == content_hash:
+            return False
+        
+        values = (job.get('title'), job.get('description'), content_hash,
+                  json.dumps(job, default=str), self.feature_fn(job))
+        if row is None:
+            cursor = self.conn.execute(
+                "INSERT INTO jobs (title, description, content_hash, data, features, job_key) "
+                "VALUES (?, ?, ?, ?, ?, ?)", values + (job_key,))
+            job_id = cursor.lastrowid
+        else:
+            job_id = row[0]
+            self.conn.execute(
+                "UPDATE jobs SET title = ?, description = ?, content_hash = ?, data = ?, features = ? "
+                "WHERE id = ?", values + (job_id,))
+            self.conn.execute("DELETE FROM job_skills WHERE job_id = ?", (job_id,))
+        
+        skills = {skill.lower() for skill in job['required_skills'] + job['preferred_skills']}
+        self.conn.executemany("INSERT INTO job_skills (job_id, skill) VALUES (?, ?)",
+                              [(job_id, skill) for skill in skills])
+        return True
+    
+    def upsert(self, job: Dict, source_key: Optional[str] = None) -> bool:
+        with self.conn:
+            return self._upsert(job, source_key)
+    
+    def upsert_many(self, jobs: Iterable[Dict], batch_size: int = 1000) -> int:
+        return self._upsert_keyed(((job, None) for job in jobs), batch_size)
+    
+    def _upsert_keyed(self, jobs: Iterable[Tuple[Dict, Optional[str]]], batch_size: int) -> int:
+        changed = 0
+        batch = []
+        for job, source_key in jobs:
+            batch.append((job, source_key))
+            if len(batch) >= batch_size:
+                with self.conn:
+                    changed += sum(self._upsert(j, key) for j, key in batch)
+                batch = []
+        if batch:
+            with self.conn:
+                changed += sum(self._upsert(j, key) for j, key in batch)
+        return changed
+    
+    def delete(self, job_key: str) -> bool:
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM jobs WHERE job_key = ?", (job_key,))
+        return cursor.rowcount > 0
+    
+    def import_json_dir(self, json_dir: str, batch_size: int = 1000) -> int:
+        def jobs():
+            for filename in sorted(os.listdir(json_dir)):
+                if not filename.endswith('.json'):
+                    continue
+                try:
+                    with open(os.path.join(json_dir, filename), 'r') as f:
+                        data = json.load(f)
+                except ValueError as e:
+                    print(f"Error reading {filename}: {e}")
+                    continue
+                if isinstance(data, list):
+                    for index, job in enumerate(data):
+                        yield job, f"{filename}#{index}"
+                else:
+                    yield data, filename
+        
+        return self._upsert_keyed(jobs(), batch_size)
+    
+    def import_csv(self, csv_path: str, chunk_size: int = 10000) -> int:
+        import pandas as pd
+        
+        changed = 0
+        name = os.path.basename(csv_path)
+        for chunk in pd.read_csv(csv_path, chunksize=chunk_size):
+            records = zip(chunk.to_dict('records'), chunk.index)
+            changed += self._upsert_keyed(((job, f"{name}:{row}") for job, row in records), chunk_size)
+        return changed
+    
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+    
+    def get(self, job_key: str, with_features: bool = False) -> Optional[Dict]:
+        row = self.conn.execute("SELECT id, data, features FROM jobs WHERE job_key = ?", (job_key,)).fetchone()
+        if row is None:
+            return None
+        return self._row_to_job(row, with_features)
+    
+    @staticmethod
+    def _row_to_job(row, with_features: bool) -> Dict:
+        job = json.loads(row[1])
+        job['catalog_id'] = row[0]
+        if with_features:
+            job['features'] = load_features(row[2])
+        return job
+    
+    def iter_chunks(self, title: Optional[str] = None, skill: Optional[str] = None,
+                    chunk_size: int = 1000, with_features: bool = False) -> Iterator[List[Dict]]:
+        """Yield jobs in chunks, paging by id so memory stays bounded by chunk_size"""
+        conditions = ["jobs.id > ?"]
+        params: List = []
+        if title:
+            conditions.append("jobs.title = ?")
+            params.append(title)
+        if skill:
+            conditions.append("jobs.id IN (SELECT job_id FROM job_skills WHERE skill = ?)")
+            params.append(skill.lower())
+        
+        query = (f"SELECT jobs.id, jobs.data, jobs.features FROM jobs WHERE {' AND '.join(conditions)} "
+                 f"ORDER BY jobs.id LIMIT ?")
+        last_id = 0
+        while True:
+            rows = self.conn.execute(query, [last_id] + params + [chunk_size]).fetchall()
+            if not rows:
+                return
+            yield [self._row_to_job(row, with_features) for row in rows]
+            last_id = rows[-1][0]
+    
+    def iter_jobs(self, title: Optional[str] = None, skill: Optional[str] = None,
+                  chunk_size: int = 1000, with_features: bool = False) -> Iterator[Dict]:
+        for chunk in self.iter_chunks(title, skill, chunk_size, with_features):
+            yield from chunk
@@ -0,0 +1,259 @@
+import argparse
+import glob
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# <corpus>.data holds the UTF-8 texts back to back. <corpus>.idx holds one
+# entry per text: offset (u64), length (u32), id length (u16), then the id.
+_ENTRY = struct.Struct('<QIH')
+INDEX_MAGIC = b'RCPK\x01'
+
+
+def is_packed_corpus(path: str) -> bool:
+    return os.path.exists(path + '.idx') and os.path.exists(path + '.data')
+
+
+class PackedCorpus:
+    """Append-only corpus of (id, text) pairs in one data file plus an offset index.
+
+    Reads go through one mmap of the data file, so random access and full
+    scans need no per-document open/read/close. Appending a text under an
+    existing id supersedes the old entry; the old bytes stay in the file.
+    The data is written before the index, so an interrupted append leaves at
+    most a trailing, incomplete or dangling index entry. Readers ignore it,
+    and opening the corpus writable truncates the index back to its last
+    valid entry before anything new is appended.
+    """
+
+    def __init__(self, path: str, writable: bool = False):
+        self.path = path
+        self.writable = writable
+        self._offsets: List[int] = []
+        self._lengths: List[int] = []
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._data_file = None
+        self._index_file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._mapped_size = 0
+        self._index_end = len(INDEX_MAGIC)
+
+        if writable:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if not os.path.exists(path + '.idx'):
+                with open(path + '.idx', 'wb') as f:
+                    f.write(INDEX_MAGIC)
+                open(path + '.data', 'ab').close()
+        elif not is_packed_corpus(path):
+            raise FileNotFoundError(f"No packed corpus at {path}")
+
+        self._load_index()
+        if writable:
+            if os.path.getsize(path + '.idx') > self._index_end:
+                print(f"Truncating {path}.idx to its last complete entry")
+                os.truncate(path + '.idx', self._index_end)
+            self._data_file = open(path + '.data', 'ab')
+            self._index_file = open(path + '.idx', 'ab')
+            self._data_size = self._data_file.tell()
+
+    def _load_index(self) -> None:
+        with open(self.path + '.idx', 'rb') as f:
+            index = f.read()
+        if not index.startswith(INDEX_MAGIC):
+            raise ValueError(f"Not a packed corpus index: {self.path}.idx")
+
+        data_size = os.path.getsize(self.path + '.data')
+        pos = len(INDEX_MAGIC)
+        while pos < len(index):
+            if pos + _ENTRY.size > len(index):
+                print(f"Ignoring incomplete trailing entries in {self.path}.idx")
+                break
+            offset, length, id_length = _ENTRY.unpack_from(index, pos)
+            end = pos + _ENTRY.size + id_length
+            if end > len(index) or offset + length > data_size:
+                print(f"Ignoring incomplete trailing entries in {self.path}.idx")
+                break
+            doc_id = index[pos + _ENTRY.size:end].decode('utf-8')
+            self._add_entry(doc_id, offset, length)
+            pos = end
+        self._index_end = pos
+
+    def _add_entry(self, doc_id: str, offset: int, length: int) -> None:
+        self._positions[doc_id] = len(self._ids)
+        self._ids.append(doc_id)
+        self._offsets.append(offset)
+        self._lengths.append(length)
+
+    def append(self, doc_id: str, text: str) -> None:
+        if not self.writable:
+            raise ValueError("Corpus was opened read-only")
+        data = text.encode('utf-8')
+        encoded_id = doc_id.encode('utf-8')
+        self._data_file.write(data)
+        self._index_file.write(_ENTRY.pack(self._data_size, len(data), len(encoded_id)) + encoded_id)
+        self._add_entry(doc_id, self._data_size, len(data))
+        self._data_size += len(data)
+
+    def extend(self, documents: Iterable[Tuple[str, str]]) -> int:
+        count = 0
+        for doc_id, text in documents:
+            self.append(doc_id, text)
+            count += 1
+        self.flush()
+        return count
+
+    def flush(self) -> None:
+        if self.writable:
+            # Data first, so the index never points past the end of the data file
+            self._data_file.flush()
+            self._index_file.flush()
+
+    def _buffer(self) -> mmap.mmap:
+        needed = self._offsets[-1] + self._lengths[-1] if self._offsets else 0
+        if self._mmap is None or self._mapped_size < needed:
+            self.flush()
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            with open(self.path + '.data', 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size:
+                    self._mmap = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+            self._mapped_size = size
+        return self._mmap
+
+    def text_at(self, position: int) -> str:
+        offset, length = self._offsets[position], self._lengths[position]
+        if not length:
+            return ''
+        return self._buffer()[offset:offset + length].decode('utf-8')
+
+    def get(self, doc_id: str) -> Optional[str]:
+        position = self._positions.get(doc_id)
+        return None if position is None else self.text_at(position)
+
+    def __getitem__(self, doc_id: str) -> str:
+        text = self.get(doc_id)
+        if text is None:
+            raise KeyError(doc_id)
+        return text
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def ids(self) -> List[str]:
+        return [doc_id for position, doc_id in enumerate(self._ids) if self._positions[doc_id] == position]
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        # Sequential scan in append order, skipping superseded entries
+        buffer = self._buffer()
+        for position, doc_id in enumerate(self._ids):
+            if self._positions[doc_id] != position:
+                continue
+            offset, length = self._offsets[position], self._lengths[position]
+            yield doc_id, buffer[offset:offset + length].decode('utf-8') if length else ''
+
+    def close(self) -> None:
+        self.flush()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        for handle in (self._data_file, self._index_file):
+            if handle is not None:
+                handle.close()
+        self._data_file = self._index_file = None
+
+    def __enter__(self) -> 'PackedCorpus':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def iter_directory(input_dir: str, pattern: str = '*.txt', strip_extension: bool = True) -> Iterator[Tuple[str, str]]:
+    # Ids are paths relative to input_dir, e.g. "resume_1" or "resume_1/analysis_results.json"
+    for path in sorted(glob.glob(os.path.join(input_dir, pattern), recursive=True)):
+        if not os.path.isfile(path):
+            continue
+        doc_id = os.path.relpath(path, input_dir).replace(os.sep, '/')
+        if strip_extension:
+            doc_id = os.path.splitext(doc_id)[0]
+        with open(path, 'r', encoding='utf-8') as f:
+            yield doc_id, f.read()
+
+
+def pack_directory(input_dir: str, corpus_path: str, pattern: str = '*.txt', strip_extension: bool = True) -> int:
+    with PackedCorpus(corpus_path, writable=True) as corpus:
+        return corpus.extend(iter_directory(input_dir, pattern, strip_extension))
+
+
+def pack_resumes(source: str, corpus_path: str) -> int:
+    # Rendered raw_text of resume JSON/JSONL, keyed by resume id
+    from .resume_ingestion import iter_resumes
+    with PackedCorpus(corpus_path, writable=True) as corpus:
+        return corpus.extend((record['id'], record['raw_text']) for record in iter_resumes(source))
+
+
+def unpack(corpus_path: str, output_dir: str, extension: str = '.txt') -> int:
+    count = 0
+    with PackedCorpus(corpus_path) as corpus:
+        for doc_id, text in corpus:
+            path = os.path.join(output_dir, doc_id + extension)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            count += 1
+    return count
+
+
+def iter_packed_records(corpus_path: str) -> Iterator[Dict]:
+    # Same 'id'/'raw_text' keys as resume_ingestion records
+    with PackedCorpus(corpus_path) as corpus:
+        for doc_id, text in corpus:
+            yield {'id': doc_id, 'raw_text': text}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Packed, memory-mapped text corpora")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    pack_parser = subparsers.add_parser('pack', help="Pack a directory of text files")
+    pack_parser.add_argument('input_dir')
+    pack_parser.add_argument('corpus')
+    pack_parser.add_argument('--pattern', default='*.txt', help="Glob under input_dir, e.g. '*/*.json' for output trees")
+    pack_parser.add_argument('--keep-extension', action='store_true', help="Keep file extensions in ids")
+
+    json_parser = subparsers.add_parser('pack-json', help="Pack rendered resumes from JSON/JSONL")
+    json_parser.add_argument('source')
+    json_parser.add_argument('corpus')
+
+    unpack_parser = subparsers.add_parser('unpack', help="Write every text back out as a file")
+    unpack_parser.add_argument('corpus')
+    unpack_parser.add_argument('output_dir')
+    unpack_parser.add_argument('--extension', default='.txt')
+
+    stats_parser = subparsers.add_parser('stats', help="Document count and data size")
+    stats_parser.add_argument('corpus')
+    args = parser.parse_args()
+
+    if args.command == 'pack':
+        count = pack_directory(args.input_dir, args.corpus, args.pattern, not args.keep_extension)
+        print(f"Packed {count} documents into {args.corpus}")
+    elif args.command == 'pack-json':
+        print(f"Packed {pack_resumes(args.source, args.corpus)} resumes into {args.corpus}")
+    elif args.command == 'unpack':
+        print(f"Wrote {unpack(args.corpus, args.output_dir, args.extension)} files to {args.output_dir}")
+    else:
+        with PackedCorpus(args.corpus) as corpus:
+            print(f"{len(corpus)} documents, {os.path.getsize(args.corpus + '.data') / 1e6:.1f} MB of text")
+
+
+if __name__ == '__main__':
+    main()
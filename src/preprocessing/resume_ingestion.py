@@ -0,0 +1,121 @@
+import glob
+import json
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+def render_sections(resume_json: Dict) -> List[Tuple[str, List[str]]]:
+    """Render each section of a resume JSON object as (header, lines)"""
+    experience = []
+    for exp in resume_json['experience']:
+        experience.append(f"{exp['title']} at {exp['company']}")
+        experience.append(f"Duration: {exp['duration']}")
+        for desc in exp['description']:
+            experience.append(f"• {desc}")
+        experience.append("")
+    
+    education = []
+    for edu in resume_json['education']:
+        education.append(f"{edu['degree']} in {edu['field']}")
+        education.append(f"{edu['university']}, {edu['year']}")
+        education.append("")
+    
+    return [
+        ("HEADER", [
+            resume_json['name'].upper(),
+            f"Email: {resume_json['email']}",
+            f"Phone: {resume_json['phone']}",
+            f"Location: {resume_json['location']}"
+        ]),
+        ("PROFESSIONAL SUMMARY", [resume_json['summary']]),
+        ("SKILLS", [", ".join(resume_json['skills'])]),
+        ("PROFESSIONAL EXPERIENCE", experience),
+        ("EDUCATION", education)
+    ]
+
+def convert_resume_to_txt(resume_json: Dict) -> str:
+    """Convert a resume JSON object to formatted text"""
+    text = []
+    for header, lines in render_sections(resume_json):
+        if header != "HEADER":
+            text.append(header)
+            text.append("-" * 20)
+        text.extend(lines)
+        if header != "EDUCATION":
+            text.append("\n")
+    
+    return "\n".join(text)
+
+def resume_record(resume_id: str, resume_json: Dict) -> Dict:
+    """Build a parsed resume (same shape as ResumeParser.parse_resume) straight from JSON"""
+    sections = {}
+    for header, lines in render_sections(resume_json):
+        content = [line for line in lines if line]
+        if content:
+            sections[header] = '\n'.join(content)
+    
+    return {
+        'id': resume_id,
+        'sections': sections,
+        'contact_info': {'email': resume_json['email'], 'phone': resume_json['phone']},
+        'skills': list(resume_json['skills']),
+        'raw_text': convert_resume_to_txt(resume_json)
+    }
+
+def resume_files(source: Union[str, Iterable[str]]) -> List[str]:
+    """Expand a directory, glob pattern, file path or list of paths into resume .json/.jsonl files"""
+    if isinstance(source, str):
+        if os.path.isdir(source):
+            # resume_N.json files and resumes-NNNNN.jsonl shards; skips manifest.json and jobs-* shards
+            paths = glob.glob(os.path.join(source, 'resume*.json')) + glob.glob(os.path.join(source, 'resume*.jsonl'))
+        elif glob.has_magic(source):
+            paths = glob.glob(source)
+        else:
+            paths = [source]
+    else:
+        paths = list(source)
+    
+    return sorted(p for p in paths if p.endswith('.json') or p.endswith('.jsonl'))
+
+def iter_resume_json(source: Union[str, Iterable[str]]) -> Iterator[Tuple[str, Dict]]:
+    """Yield (resume_id, resume_json) from resume_*.json files and JSONL shards"""
+    for path in resume_files(source):
+        stem = os.path.splitext(os.path.basename(path))[0]
+        
+        if path.endswith('.jsonl'):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line_num, line in enumerate(f):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        resume_json = json.loads(line)
+                    except ValueError as e:
+                        print(f"Skipping malformed line {line_num + 1} in {path}: {e}")
+                        continue
+                    yield resume_json.get('id', f"{stem}_{line_num}"), resume_json
+        else:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    resume_json = json.load(f)
+            except ValueError as e:
+                print(f"Skipping malformed resume {path}: {e}")
+                continue
+            yield resume_json.get('id', stem), resume_json
+
+def iter_resumes(source: Union[str, Iterable[str]], materialize_dir: Optional[str] = None) -> Iterator[Dict]:
+    """Stream parsed resume records from JSON/JSONL, optionally writing the rendered .txt files too"""
+    if materialize_dir:
+        os.makedirs(materialize_dir, exist_ok=True)
+    
+    for resume_id, resume_json in iter_resume_json(source):
+        try:
+            record = resume_record(resume_id, resume_json)
+        except KeyError as e:
+            print(f"Skipping resume {resume_id}: missing field {e}")
+            continue
+        
+        if materialize_dir:
+            with open(os.path.join(materialize_dir, f"{resume_id}.txt"), 'w', encoding='utf-8') as f:
+                f.write(record['raw_text'])
+        
+        yield record
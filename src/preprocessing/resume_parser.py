@@ -2,9 +2,14 @@ import PyPDF2
 import os
 import re
 from typing import Dict, List, Optional
+from .text_cache import TextCache
+from .skill_matcher import SkillMatcher
 
 class ResumeParser:
-    def __init__(self):
+    def __init__(self, cache_size: int = 128, cache_dir: Optional[str] = None,
+                 skill_matcher: Optional[SkillMatcher] = None):
+        self.cache = TextCache(max_entries=cache_size, cache_dir=cache_dir)
+        self.skill_matcher = skill_matcher
         self.section_headers = [
             'EDUCATION', 'EXPERIENCE', 'WORK EXPERIENCE', 'EMPLOYMENT HISTORY',
             'PROFESSIONAL EXPERIENCE', 'SKILLS', 'TECHNICAL SKILLS', 'CORE COMPETENCIES',
@@ -50,13 +55,22 @@ class ResumeParser:
     
     def extract_text(self, file_path: str) -> Optional[str]:
         if file_path.lower().endswith('.pdf'):
-            return self.extract_text_from_pdf(file_path)
+            if not os.path.exists(file_path):
+                print(f"File not found: {file_path}")
+                return None
+            return self.cache.get_or_extract(file_path, self.extract_text_from_pdf)
         elif file_path.lower().endswith('.txt'):
             return self.extract_text_from_txt(file_path)
         else:
             print(f"Unsupported file format: {file_path}")
             return None
     
+    def invalidate_cache(self, file_path: Optional[str] = None) -> None:
+        self.cache.invalidate(file_path)
+    
+    def cache_stats(self) -> Dict[str, float]:
+        return self.cache.stats()
+    
     def extract_sections(self, text: str) -> Dict[str, str]:
         sections = {}
         current_section = "HEADER"
@@ -103,6 +117,10 @@ class ResumeParser:
         return contact_info
     
     def extract_skills(self, text: str) -> List[str]:
+        # A dictionary matcher scans the whole text once and handles multi-word/punctuated skills
+        if self.skill_matcher is not None:
+            return list(dict.fromkeys(hit.skill for hit in self.skill_matcher.find(text)))
+        
         skills = []
         
         skill_section = None
@@ -0,0 +1,196 @@
+import ast
+import csv
+import os
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+# Alternate spellings mapped to the canonical skill name
+DEFAULT_ALIASES = {
+    'Node.js': ['nodejs', 'node js'],
+    'JavaScript': ['js'],
+    'Kubernetes': ['k8s'],
+    'CI/CD': ['ci cd', 'cicd', 'ci-cd'],
+    'PostgreSQL': ['postgres', 'postgre sql'],
+    'MongoDB': ['mongo db', 'mongo'],
+    'Machine Learning': ['ml'],
+    'NLP': ['natural language processing'],
+    'REST APIs': ['rest api', 'restful api', 'restful apis'],
+    'AWS': ['amazon web services'],
+    'GCP': ['google cloud', 'google cloud platform'],
+    'Azure': ['microsoft azure'],
+    'C++': ['cpp'],
+    'C#': ['csharp', 'c sharp'],
+    'React': ['react.js', 'reactjs'],
+    'React Native': ['react-native'],
+    'UI Design': ['user interface design'],
+    'Data Warehousing': ['data warehouse']
+}
+
+
+class SkillHit(NamedTuple):
+    skill: str
+    start: int
+    end: int
+    text: str
+
+
+def _normalize_char(char: str) -> str:
+    if char.isspace():
+        return ' '
+    lowered = char.lower()
+    # Keep offsets aligned with the original text
+    return lowered if len(lowered) == 1 else char
+
+
+def normalize_skill(skill: str) -> str:
+    return ' '.join(''.join(_normalize_char(c) for c in skill).split())
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over a skill dictionary.
+
+    One left-to-right pass over the raw text finds every dictionary entry,
+    including multi-word and punctuated skills ("Machine Learning", "CI/CD",
+    "C++"), independent of dictionary size. Matching is case-insensitive,
+    treats any run of whitespace as one space, and only accepts hits that are
+    not embedded in a longer word ("Java" does not match inside "JavaScript").
+    """
+
+    def __init__(self, skills: Iterable[str], aliases: Optional[Dict[str, List[str]]] = None):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._patterns: List[str] = []
+        self._canonical: List[str] = []
+        
+        entries: Dict[str, str] = {}
+        for skill in skills:
+            entries.setdefault(normalize_skill(skill), skill)
+        for canonical, names in (aliases or {}).items():
+            entries.setdefault(normalize_skill(canonical), canonical)
+            for name in names:
+                entries.setdefault(normalize_skill(name), canonical)
+        
+        for pattern, canonical in entries.items():
+            if pattern:
+                self._insert(pattern, canonical)
+        self._build_failure_links()
+        self.skills: Set[str] = set(self._canonical)
+
+    def _insert(self, pattern: str, canonical: str) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(len(self._patterns))
+        self._patterns.append(pattern)
+        self._canonical.append(canonical)
+
+    def _build_failure_links(self) -> None:
+        # Depth-one states fail back to the root; deeper ones follow their parent's failure chain
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    @staticmethod
+    def _is_boundary(text: str, index: int) -> bool:
+        return index < 0 or index >= len(text) or not text[index].isalnum()
+
+    def find(self, text: str, overlapping: bool = False) -> List[SkillHit]:
+        hits = []
+        state = 0
+        # positions[i] is the original offset of the i-th normalized character
+        positions: List[int] = []
+        previous_space = True
+        for offset, raw_char in enumerate(text):
+            char = _normalize_char(raw_char)
+            if char == ' ':
+                if previous_space:
+                    continue
+                previous_space = True
+            else:
+                previous_space = False
+            positions.append(offset)
+            
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            
+            for pattern_id in self._output[state]:
+                length = len(self._patterns[pattern_id])
+                start = positions[len(positions) - length]
+                end = offset + 1
+                if self._is_boundary(text, start - 1) and self._is_boundary(text, end):
+                    hits.append(SkillHit(self._canonical[pattern_id], start, end, text[start:end]))
+        
+        if overlapping:
+            return hits
+        
+        # Keep the longest hit wherever hits overlap ("js" inside "Node.js")
+        resolved = []
+        for hit in sorted(hits, key=lambda h: (h.start, -(h.end - h.start))):
+            if resolved and hit.start < resolved[-1].end:
+                continue
+            resolved.append(hit)
+        return resolved
+
+    def skills_in(self, text: str) -> Set[str]:
+        return {hit.skill for hit in self.find(text)}
+
+    def skill_gap(self, resume_text: str, job_skills: Iterable[str]) -> Dict[str, List[str]]:
+        found = self.skills_in(resume_text)
+        required = []
+        for skill in job_skills:
+            canonical = self.skills_in(skill)
+            required.extend(canonical or [skill])
+        required = list(dict.fromkeys(required))
+        return {
+            'matched': [skill for skill in required if skill in found],
+            'missing': [skill for skill in required if skill not in found]
+        }
+
+
+def load_csv_skills(csv_path: str) -> Set[str]:
+    skills = set()
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            for column in ('required_skills', 'preferred_skills'):
+                value = (row.get(column) or '').strip()
+                if not value:
+                    continue
+                try:
+                    items = ast.literal_eval(value) if value.startswith('[') else value.split(',')
+                except (ValueError, SyntaxError):
+                    items = value.strip('[]').split(',')
+                skills.update(str(item).strip().strip('\'"') for item in items if str(item).strip())
+    return skills
+
+
+def load_job_title_skills() -> Set[str]:
+    try:
+        from generate_data import JOB_TITLES
+    except ImportError:
+        return set()
+    return {skill for skills in JOB_TITLES.values() for skill in skills}
+
+
+def build_skill_matcher(jobs_csv: Optional[str] = 'data/raw/jobs/sample_jobs.csv',
+                        extra_skills: Iterable[str] = (),
+                        aliases: Optional[Dict[str, List[str]]] = None) -> SkillMatcher:
+    skills = set(extra_skills) | load_job_title_skills()
+    if jobs_csv and os.path.exists(jobs_csv):
+        skills |= load_csv_skills(jobs_csv)
+    return SkillMatcher(skills, DEFAULT_ALIASES if aliases is None else aliases)
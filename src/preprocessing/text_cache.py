@@ -0,0 +1,147 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+
+class TextCache:
+    """Two-tier cache of extracted document text.
+
+    The memory tier is an LRU keyed by (path, size, mtime), so an unchanged
+    file is served without touching its contents. The optional disk tier is
+    keyed by the SHA-256 of the file contents and survives process restarts;
+    without it the contents are never hashed. One cache can be shared by
+    several threads; extraction itself runs outside the lock.
+    """
+
+    def __init__(self, max_entries: int = 128, cache_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._memory: "OrderedDict[Tuple[str, int, int], Tuple[Optional[str], str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def file_key(file_path: str) -> Tuple[str, int, int]:
+        stat = os.stat(file_path)
+        return (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+    @staticmethod
+    def content_hash(file_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _disk_path(self, content_hash: str) -> str:
+        return os.path.join(self.cache_dir, f"{content_hash}.txt")
+
+    def _read_disk(self, content_hash: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(content_hash)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as file:
+            return file.read()
+
+    def _write_disk(self, content_hash: str, text: str) -> None:
+        if not self.cache_dir:
+            return
+        path = self._disk_path(content_hash)
+        # A unique temp file per write, so threads storing the same content never share one
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            file.write(text)
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # Lost a race to another writer; the entry already holds the same text
+            os.remove(tmp_path)
+            if not os.path.exists(path):
+                raise
+
+    def _remember(self, key: Tuple[str, int, int], content_hash: Optional[str], text: str) -> None:
+        with self._lock:
+            # Drop entries for older versions of the same file
+            for stale in [k for k in self._memory if k[0] == key[0] and k != key]:
+                del self._memory[stale]
+            self._memory[key] = (content_hash, text)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def get_or_extract(self, file_path: str, extract: Callable[[str], Optional[str]]) -> Optional[str]:
+        key = self.file_key(file_path)
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return cached[1]
+
+        # Only the disk tier needs the content hash
+        content_hash = self.content_hash(file_path) if self.cache_dir else None
+        if content_hash is not None:
+            text = self._read_disk(content_hash)
+            if text is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                self._remember(key, content_hash, text)
+                return text
+
+        with self._lock:
+            self.misses += 1
+        text = extract(file_path)
+        if text is not None:
+            self._remember(key, content_hash, text)
+            if content_hash is not None:
+                self._write_disk(content_hash, text)
+        return text
+
+    def invalidate(self, file_path: Optional[str] = None) -> None:
+        with self._lock:
+            if file_path is None:
+                hashes = {content_hash for content_hash, _ in self._memory.values()}
+                self._memory.clear()
+            else:
+                path = os.path.abspath(file_path)
+                keys = [k for k in self._memory if k[0] == path]
+                hashes = {self._memory.pop(k)[0] for k in keys}
+        hashes.discard(None)
+
+        # Disk entries are keyed by content and shared by every file with the same bytes, so
+        # invalidating one path only drops its memory entries. A changed file hashes differently anyway.
+        if self.cache_dir and file_path is None:
+            for content_hash in hashes:
+                try:
+                    os.remove(self._disk_path(content_hash))
+                except FileNotFoundError:
+                    pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self.cache_dir:
+            for filename in os.listdir(self.cache_dir):
+                if filename.endswith('.txt'):
+                    os.remove(os.path.join(self.cache_dir, filename))
+
+    def stats(self) -> Dict[str, float]:
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'entries': len(self._memory),
+            'hit_rate': hits / lookups if lookups > 0 else 0.0
+        }
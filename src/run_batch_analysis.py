@@ -1,21 +1,33 @@
 import os
+import argparse
+import threading
 import pandas as pd
 import json
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 from models.simplified_model import SimplifiedModel
 from preprocessing.resume_parser import ResumeParser
+from models.runtime_profile import load_runtime_profile, stage_workers
+from utils.prefork import PreforkPool, prefork_available
+from preprocessing.resume_ingestion import iter_resumes
+from preprocessing.packed_corpus import is_packed_corpus, iter_packed_records
+from utils.staged_pipeline import Stage, StagedPipeline
+from utils.sampling_profiler import add_profile_arguments, run_profiled
 
 def load_job_descriptions(jobs_file: str) -> pd.DataFrame:
     return pd.read_csv(jobs_file)
 
 def analyze_resume(resume_path: str, job_descriptions: pd.DataFrame, model: SimplifiedModel, parser: ResumeParser) -> List[Dict[str, Any]]:
-    results = []
     resume_text = parser.extract_text_from_txt(resume_path)
     
     if not resume_text:
         print(f"Failed to extract text from {resume_path}")
-        return results
+        return []
     
+    return analyze_resume_text(resume_text, job_descriptions, model)
+
+def analyze_resume_text(resume_text: str, job_descriptions: pd.DataFrame, model: SimplifiedModel) -> List[Dict[str, Any]]:
+    results = []
     for _, job in job_descriptions.iterrows():
         analysis = model.analyze_resume(resume_text, job['description'])
         results.append({
@@ -49,27 +61,147 @@ def save_results(results: List[Dict[str, Any]], output_dir: str, resume_name: st
                 f.write(f"- {suggestion}\n")
             f.write("\n" + "=" * 50 + "\n\n")
 
-def main():
+def scoring_stages(job_descriptions: pd.DataFrame, output_dir: str, profile: Dict,
+                   model: Optional[SimplifiedModel] = None) -> List[Stage]:
+    # Items are (label, resume_name, resume_text); the writer stage owns all output files
+    workers = stage_workers(profile)
+    queue_size = int(profile.get('queue_size') or 32)
+    
+    # A caller-supplied model is shared, so it gets a single scorer; otherwise each scorer thread builds its own
+    scorer_workers = 1 if model is not None else workers['scorer']
+    local = threading.local()
+    
+    def scorer_model() -> SimplifiedModel:
+        if model is not None:
+            return model
+        if not hasattr(local, 'model'):
+            local.model = SimplifiedModel()
+        return local.model
+    
+    def score(item: Tuple[str, str, str]) -> Optional[Tuple[str, str, List[Dict[str, Any]]]]:
+        label, resume_name, resume_text = item
+        try:
+            return label, resume_name, analyze_resume_text(resume_text, job_descriptions, scorer_model())
+        except Exception as e:
+            print(f"Error processing {label}: {e}")
+            return None
+    
+    def write(item: Tuple[str, str, List[Dict[str, Any]]]) -> Optional[str]:
+        label, resume_name, results = item
+        try:
+            save_results(results, output_dir, resume_name)
+        except Exception as e:
+            print(f"Error processing {label}: {e}")
+            return None
+        print(f"Completed analysis for {label}")
+        return label
+    
+    return [
+        Stage('scorer', score, workers=scorer_workers, queue_size=queue_size),
+        Stage('writer', write, workers=workers['writer'], queue_size=queue_size)
+    ]
+
+def run_staged(filenames: List[str], resumes_dir: str, output_dir: str, job_descriptions: pd.DataFrame,
+               parser: ResumeParser, profile: Dict, model: Optional[SimplifiedModel] = None) -> StagedPipeline:
+    # Reading, scoring and writing overlap instead of running strictly in turn for each resume
+    def read(filename: str) -> Optional[Tuple[str, str, str]]:
+        resume_text = parser.extract_text_from_txt(os.path.join(resumes_dir, filename))
+        if not resume_text:
+            print(f"Failed to extract text from {os.path.join(resumes_dir, filename)}")
+            return None
+        return filename, os.path.splitext(filename)[0], resume_text
+    
+    reader = Stage('reader', read, workers=stage_workers(profile)['reader'],
+                   queue_size=int(profile.get('queue_size') or 32))
+    pipeline = StagedPipeline([reader] + scoring_stages(job_descriptions, output_dir, profile, model))
+    pipeline.run(filenames)
+    return pipeline
+
+def analyze_json_resumes(json_source: str, job_descriptions: pd.DataFrame, model: Optional[SimplifiedModel],
+                         output_dir: str, materialize_dir: Optional[str] = None,
+                         profile: Optional[Dict] = None) -> StagedPipeline:
+    # iter_resumes already streams parsed records, so it acts as the reader stage
+    if is_packed_corpus(json_source):
+        source = iter_packed_records(json_source)
+    else:
+        source = iter_resumes(json_source, materialize_dir=materialize_dir)
+    records = ((record['id'], record['id'], record['raw_text']) for record in source)
+    pipeline = StagedPipeline(scoring_stages(job_descriptions, output_dir, profile or load_runtime_profile(), model))
+    pipeline.run(records)
+    return pipeline
+
+def process_resume(filename: str, resumes_dir: str, output_dir: str, job_descriptions: pd.DataFrame,
+                   model: SimplifiedModel, parser: ResumeParser) -> str:
+    resume_path = os.path.join(resumes_dir, filename)
+    resume_name = os.path.splitext(filename)[0]
+    
+    try:
+        results = analyze_resume(resume_path, job_descriptions, model, parser)
+        save_results(results, output_dir, resume_name)
+        return f"Completed analysis for {filename}"
+    except Exception as e:
+        return f"Error processing {filename}: {e}"
+
+_worker_state: Dict[str, Any] = {}
+
+def _init_worker(jobs_file: str) -> None:
+    _worker_state['model'] = SimplifiedModel()
+    _worker_state['parser'] = ResumeParser()
+    _worker_state['job_descriptions'] = load_job_descriptions(jobs_file)
+
+def _process_in_worker(task: Tuple[str, str, str]) -> str:
+    filename, resumes_dir, output_dir = task
+    return process_resume(filename, resumes_dir, output_dir, _worker_state['job_descriptions'],
+                          _worker_state['model'], _worker_state['parser'])
+
+def main(model: Optional[SimplifiedModel] = None, parser: Optional[ResumeParser] = None,
+         json_source: Optional[str] = None, materialize_dir: Optional[str] = None,
+         workers: Optional[int] = None):
     jobs_file = "data/raw/jobs/sample_jobs.csv"
     resumes_dir = "data/raw/resumes_txt"
     output_dir = "output"
     
-    model = SimplifiedModel()
-    parser = ResumeParser()
+    filenames = [] if json_source else [filename for filename in os.listdir(resumes_dir) if filename.endswith('.txt')]
+    
+    # Worker count comes from the autotune runtime profile; shared models always run in-process
+    profile = load_runtime_profile()
+    workers = workers or int(profile.get('workers') or 1)
+    if model is None and workers > 1 and not json_source:
+        tasks = [(filename, resumes_dir, output_dir) for filename in filenames]
+        if prefork_available():
+            # Load once in the parent; forked workers share the model pages copy-on-write
+            _init_worker(jobs_file)
+            with PreforkPool(_process_in_worker, workers) as pool:
+                for message in pool.imap_unordered(tasks):
+                    print(message)
+                print(pool.report())
+            return
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(jobs_file,)) as executor:
+            for message in executor.map(_process_in_worker, tasks, chunksize=8):
+                print(message)
+        return
+    
+    parser = parser or ResumeParser()
     
     job_descriptions = load_job_descriptions(jobs_file)
     
-    for filename in os.listdir(resumes_dir):
-        if filename.endswith('.txt'):
-            resume_path = os.path.join(resumes_dir, filename)
-            resume_name = os.path.splitext(filename)[0]
-            
-            try:
-                results = analyze_resume(resume_path, job_descriptions, model, parser)
-                save_results(results, output_dir, resume_name)
-                print(f"Completed analysis for {filename}")
-            except Exception as e:
-                print(f"Error processing {filename}: {e}")
+    # Read resume JSON/JSONL directly instead of the converted .txt files
+    if json_source:
+        pipeline = analyze_json_resumes(json_source, job_descriptions, model, output_dir, materialize_dir, profile)
+    else:
+        pipeline = run_staged(filenames, resumes_dir, output_dir, job_descriptions, parser, profile, model)
+    print(pipeline.report())
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    arg_parser = argparse.ArgumentParser(description="Analyze every resume against the sample jobs")
+    arg_parser.add_argument('json_source', nargs='?', default=None,
+                            help="Resume JSON/JSONL file, directory or glob, or a packed corpus, to ingest directly")
+    add_profile_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    
+    if args.profile:
+        # Profiling samples this process only, so worker processes are disabled
+        run_profiled(lambda profiler: main(json_source=args.json_source, workers=1), args.profile,
+                     args.profile_interval / 1000, args.profile_top)
+    else:
+        main(json_source=args.json_source)
\ No newline at end of file
@@ -1,9 +1,14 @@
 import os
+import argparse
 import pandas as pd
 import json
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 from models.simplified_model import SimplifiedModel
 from preprocessing.resume_parser import ResumeParser
+from models.runtime_profile import load_runtime_profile
+from utils.prefork import PreforkPool, prefork_available
+from utils.sampling_profiler import add_profile_arguments, run_profiled
 
 def load_job_descriptions(jobs_file: str) -> pd.DataFrame:
     return pd.read_csv(jobs_file)
@@ -53,27 +58,70 @@ def save_results(results: List[Dict[str, Any]], output_dir: str, resume_name: st
                 f.write(f"- {suggestion}\n")
             f.write("\n" + "=" * 50 + "\n\n")
 
-def main():
+def process_resume(filename: str, resumes_dir: str, output_dir: str, job_descriptions: pd.DataFrame,
+                   model: SimplifiedModel, parser: ResumeParser) -> str:
+    resume_path = os.path.join(resumes_dir, filename)
+    resume_name = os.path.splitext(filename)[0]
+    
+    try:
+        results = analyze_resume(resume_path, job_descriptions, model, parser)
+        save_results(results, output_dir, resume_name)
+        return f"Completed extended analysis for {filename}"
+    except Exception as e:
+        return f"Error processing {filename}: {e}"
+
+_worker_state: Dict[str, Any] = {}
+
+def _init_worker(jobs_file: str) -> None:
+    _worker_state['model'] = SimplifiedModel()
+    _worker_state['parser'] = ResumeParser()
+    _worker_state['job_descriptions'] = load_job_descriptions(jobs_file)
+
+def _process_in_worker(task: Tuple[str, str, str]) -> str:
+    filename, resumes_dir, output_dir = task
+    return process_resume(filename, resumes_dir, output_dir, _worker_state['job_descriptions'],
+                          _worker_state['model'], _worker_state['parser'])
+
+def main(model: Optional[SimplifiedModel] = None, parser: Optional[ResumeParser] = None,
+         workers: Optional[int] = None):
     jobs_file = "data/raw/jobs/sample_jobs.csv"
     resumes_dir = "data/raw/resumes_txt"
     output_dir = "output/extended_analysis"
     
-    model = SimplifiedModel()
-    parser = ResumeParser()
+    filenames = [filename for filename in os.listdir(resumes_dir) if filename.endswith('.txt')]
+    
+    # Worker count comes from the autotune runtime profile; shared models always run in-process
+    workers = workers or int(load_runtime_profile().get('workers') or 1)
+    if model is None and workers > 1:
+        tasks = [(filename, resumes_dir, output_dir) for filename in filenames]
+        if prefork_available():
+            # Load once in the parent; forked workers share the model pages copy-on-write
+            _init_worker(jobs_file)
+            with PreforkPool(_process_in_worker, workers) as pool:
+                for message in pool.imap_unordered(tasks):
+                    print(message)
+                print(pool.report())
+            return
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(jobs_file,)) as executor:
+            for message in executor.map(_process_in_worker, tasks, chunksize=8):
+                print(message)
+        return
+    
+    model = model or SimplifiedModel()
+    parser = parser or ResumeParser()
     
     job_descriptions = load_job_descriptions(jobs_file)
     
-    for filename in os.listdir(resumes_dir):
-        if filename.endswith('.txt'):
-            resume_path = os.path.join(resumes_dir, filename)
-            resume_name = os.path.splitext(filename)[0]
-            
-            try:
-                results = analyze_resume(resume_path, job_descriptions, model, parser)
-                save_results(results, output_dir, resume_name)
-                print(f"Completed extended analysis for {filename}")
-            except Exception as e:
-                print(f"Error processing {filename}: {e}")
+    for filename in filenames:
+        print(process_resume(filename, resumes_dir, output_dir, job_descriptions, model, parser))
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    arg_parser = argparse.ArgumentParser(description="Run the extended analysis over every resume")
+    add_profile_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    
+    if args.profile:
+        # Profiling samples this process only, so worker processes are disabled
+        run_profiled(lambda profiler: main(workers=1), args.profile, args.profile_interval / 1000, args.profile_top)
+    else:
+        main() 
\ No newline at end of file
@@ -0,0 +1,301 @@
+import argparse
+import glob
+import heapq
+import json
+import multiprocessing
+import os
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from src.models.hashing_model import HashingModel
+from src.preprocessing.resume_ingestion import iter_resumes
+
+DEFAULT_N_FEATURES = 2 ** 18
+
+
+class WorkerError(Exception):
+    pass
+
+
+class ShardWorker:
+    """Holds one shard of resumes as hashed vectors and answers top-k / score queries"""
+
+    def __init__(self, documents: Sequence[Tuple[str, str]], n_features: int = DEFAULT_N_FEATURES):
+        self.model = HashingModel(n_features=n_features)
+        self.ids = [doc_id for doc_id, _ in documents]
+        self.counts = self.model.count(text for _, text in documents)
+        self.vectors = self.model.weight(self.counts)
+
+    def health(self) -> Dict:
+        return {'status': 'ok', 'documents': len(self.ids)}
+
+    def document_frequencies(self) -> Dict:
+        df, n_docs = self.model.count_document_frequencies(self.counts)
+        indices = np.flatnonzero(df)
+        return {'indices': indices.tolist(), 'counts': df[indices].tolist(), 'n_docs': n_docs}
+
+    def set_document_frequencies(self, indices: List[int], counts: List[int], n_docs: int) -> Dict:
+        df = np.zeros(self.model.n_features, dtype=np.int64)
+        df[indices] = counts
+        self.model.set_document_frequencies(df, n_docs)
+        # Re-weight the stored counts; no re-tokenizing
+        self.vectors = self.model.weight(self.counts)
+        return {'status': 'ok'}
+
+    def score_matrix(self, texts: List[str]) -> Dict:
+        queries = self.model.transform(texts)
+        scores = (self.vectors @ queries.T).toarray()
+        return {'ids': self.ids, 'scores': scores.tolist()}
+
+    def top_k(self, text: str, k: int) -> Dict:
+        if not self.ids:
+            return {'results': []}
+        scores = (self.vectors @ self.model.transform([text]).T).toarray().ravel()
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        return {'results': [[self.ids[i], float(scores[i])] for i in top]}
+
+
+def make_handler(worker: ShardWorker):
+    class WorkerHandler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, payload: Dict) -> None:
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/health':
+                self._reply(200, worker.health())
+            elif self.path == '/df':
+                self._reply(200, worker.document_frequencies())
+            else:
+                self._reply(404, {'error': f"Unknown path: {self.path}"})
+
+        def do_POST(self):
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                request = json.loads(self.rfile.read(length) or b'{}')
+                if self.path == '/idf':
+                    payload = worker.set_document_frequencies(request['indices'], request['counts'], request['n_docs'])
+                elif self.path == '/topk':
+                    payload = worker.top_k(request['text'], int(request.get('k', 10)))
+                elif self.path == '/scores':
+                    payload = worker.score_matrix(request['texts'])
+                else:
+                    self._reply(404, {'error': f"Unknown path: {self.path}"})
+                    return
+            except (KeyError, ValueError) as e:
+                self._reply(400, {'error': str(e)})
+                return
+            self._reply(200, payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return WorkerHandler
+
+
+def serve_worker(documents: Sequence[Tuple[str, str]], host: str = '127.0.0.1', port: int = 0,
+                 n_features: int = DEFAULT_N_FEATURES, ready=None) -> None:
+    server = ThreadingHTTPServer((host, port), make_handler(ShardWorker(documents, n_features)))
+    if ready is not None:
+        ready.put(server.server_address[1])
+    print(f"Worker serving {len(documents)} resumes on {host}:{server.server_address[1]}")
+    server.serve_forever()
+
+
+class Coordinator:
+    """Fans queries out to shard workers over HTTP and merges their partial results"""
+
+    def __init__(self, worker_urls: List[str], timeout: float = 30.0, retries: int = 2, backoff: float = 0.5):
+        self.worker_urls = list(worker_urls)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.executor = ThreadPoolExecutor(max_workers=max(1, len(self.worker_urls)))
+        self.idf_payload: Optional[Dict] = None
+
+    def close(self) -> None:
+        self.executor.shutdown()
+
+    def _request(self, url: str, path: str, payload: Optional[Dict] = None) -> Dict:
+        data = json.dumps(payload).encode('utf-8') if payload is not None else None
+        last_error = None
+        for attempt in range(self.retries + 1):
+            try:
+                request = urllib.request.Request(url + path, data=data, headers={'Content-Type': 'application/json'})
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    return json.loads(response.read())
+            except (urllib.error.URLError, OSError, ValueError) as e:
+                # A 4xx is the request's fault; retrying would get the same answer
+                if isinstance(e, urllib.error.HTTPError) and 400 <= e.code < 500:
+                    raise WorkerError(f"Worker {url} rejected {path}: HTTP {e.code} "
+                                      f"{e.read().decode('utf-8', 'replace')}") from e
+                last_error = e
+                if attempt < self.retries:
+                    time.sleep(self.backoff * (2 ** attempt))
+        raise WorkerError(f"Worker {url} failed on {path}: {last_error}")
+
+    def _on_failure(self, index: int, error: WorkerError) -> bool:
+        # Hook for clusters that can replace a failed worker; True means retry the call
+        return False
+
+    def _call(self, index: int, path: str, payload: Optional[Dict] = None) -> Dict:
+        try:
+            return self._request(self.worker_urls[index], path, payload)
+        except WorkerError as e:
+            if not self._on_failure(index, e):
+                raise
+            return self._request(self.worker_urls[index], path, payload)
+
+    def _fan_out(self, path: str, payload: Optional[Dict] = None) -> List[Dict]:
+        futures = [self.executor.submit(self._call, i, path, payload) for i in range(len(self.worker_urls))]
+        return [future.result() for future in futures]
+
+    def health(self) -> List[Dict]:
+        statuses = []
+        for url in self.worker_urls:
+            try:
+                status = self._request(url, '/health')
+            except WorkerError as e:
+                status = {'status': 'down', 'error': str(e)}
+            status['url'] = url
+            statuses.append(status)
+        return statuses
+
+    def sync_idf(self) -> int:
+        """Sum the shards' document frequencies and push the global IDF back to every worker"""
+        merged: Dict[int, int] = {}
+        total_docs = 0
+        for shard in self._fan_out('/df'):
+            for index, count in zip(shard['indices'], shard['counts']):
+                merged[index] = merged.get(index, 0) + count
+            total_docs += shard['n_docs']
+        self.idf_payload = {'indices': list(merged.keys()), 'counts': list(merged.values()), 'n_docs': total_docs}
+        self._fan_out('/idf', self.idf_payload)
+        return total_docs
+
+    def top_k(self, job_description: str, k: int = 10) -> List[Tuple[str, float]]:
+        partial = self._fan_out('/topk', {'text': job_description, 'k': k})
+        candidates = [(resume_id, score) for shard in partial for resume_id, score in shard['results']]
+        return heapq.nlargest(k, candidates, key=lambda x: x[1])
+
+    def score_matrix(self, job_descriptions: List[str]) -> Tuple[List[str], np.ndarray]:
+        """Similarity of every resume (rows) against every job (columns)"""
+        partial = self._fan_out('/scores', {'texts': job_descriptions})
+        ids = [resume_id for shard in partial for resume_id in shard['ids']]
+        blocks = [np.asarray(shard['scores'], dtype=np.float64).reshape(-1, len(job_descriptions)) for shard in partial]
+        return ids, np.vstack(blocks) if blocks else np.zeros((0, len(job_descriptions)))
+
+
+class LocalCluster(Coordinator):
+    """Coordinator plus one local worker process per shard; failed workers are restarted"""
+
+    def __init__(self, shards: List[Sequence[Tuple[str, str]]], n_features: int = DEFAULT_N_FEATURES, **kwargs):
+        self.shards = shards
+        self.n_features = n_features
+        self.processes: List[Optional[multiprocessing.Process]] = [None] * len(shards)
+        urls = [self._start(i) for i in range(len(shards))]
+        super().__init__(urls, **kwargs)
+        self.sync_idf()
+
+    def _start(self, index: int) -> str:
+        ready = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=serve_worker, args=(self.shards[index],),
+            kwargs={'port': 0, 'n_features': self.n_features, 'ready': ready}, daemon=True)
+        process.start()
+        # The worker binds port 0 and reports the port it actually got
+        port = ready.get(timeout=60)
+        self.processes[index] = process
+        return f"http://127.0.0.1:{port}"
+
+    def _on_failure(self, index: int, error: WorkerError) -> bool:
+        process = self.processes[index]
+        if process is not None and process.is_alive():
+            return False
+        print(f"Restarting worker {index}: {error}")
+        self.worker_urls[index] = self._start(index)
+        # A restarted worker needs the global IDF again
+        if self.idf_payload is not None:
+            self._request(self.worker_urls[index], '/idf', self.idf_payload)
+        return True
+
+    def close(self) -> None:
+        super().close()
+        for process in self.processes:
+            if process is not None and process.is_alive():
+                process.terminate()
+                process.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_documents(sources: Iterable[str]) -> List[Tuple[str, str]]:
+    documents = []
+    for source in sources:
+        for path in sorted(glob.glob(source)) if glob.has_magic(source) else [source]:
+            if path.endswith('.json') or path.endswith('.jsonl'):
+                documents.extend((record['id'], record['raw_text']) for record in iter_resumes(path))
+            elif path.endswith('.txt'):
+                with open(path, 'r', encoding='utf-8') as f:
+                    documents.append((os.path.splitext(os.path.basename(path))[0], f.read()))
+    return documents
+
+
+def partition(documents: Sequence[Tuple[str, str]], num_shards: int) -> List[List[Tuple[str, str]]]:
+    shards = [[] for _ in range(num_shards)]
+    for i, document in enumerate(documents):
+        shards[i % num_shards].append(document)
+    return shards
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sharded resume scoring")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    worker_parser = subparsers.add_parser('worker', help="Serve one shard over HTTP")
+    worker_parser.add_argument('sources', nargs='+', help="Resume .txt/.json/.jsonl files or globs")
+    worker_parser.add_argument('--host', default='127.0.0.1')
+    worker_parser.add_argument('--port', type=int, default=8000)
+    worker_parser.add_argument('--n-features', type=int, default=DEFAULT_N_FEATURES)
+    
+    query_parser = subparsers.add_parser('topk', help="Query workers for the best resumes for a job")
+    query_parser.add_argument('job_description')
+    query_parser.add_argument('--workers', nargs='*', help="Worker URLs; omit to start local workers")
+    query_parser.add_argument('--sources', nargs='*', default=['data/raw/resumes_txt/*.txt'])
+    query_parser.add_argument('--shards', type=int, default=4)
+    query_parser.add_argument('-k', type=int, default=10)
+    args = parser.parse_args()
+    
+    if args.command == 'worker':
+        serve_worker(load_documents(args.sources), host=args.host, port=args.port, n_features=args.n_features)
+        return
+    
+    if args.workers:
+        coordinator = Coordinator(args.workers)
+        coordinator.sync_idf()
+    else:
+        coordinator = LocalCluster(partition(load_documents(args.sources), args.shards))
+    try:
+        for status in coordinator.health():
+            print(f"{status['url']}: {status['status']}")
+        for resume_id, score in coordinator.top_k(args.job_description, args.k):
+            print(f"{resume_id}: {score:.4f}")
+    finally:
+        coordinator.close()
+
+
+if __name__ == '__main__':
+    main()
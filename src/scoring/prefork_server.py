@@ -0,0 +1,67 @@
+import argparse
+import json
+import os
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict
+from src.scoring.resume_scorer import ResumeScorer
+from src.utils.prefork import serve_prefork
+
+
+def make_handler(scorer: ResumeScorer):
+    class ScoringHandler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, payload: Dict) -> None:
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/health':
+                self._reply(200, {'status': 'ok', 'model': scorer.model_type, 'pid': os.getpid()})
+            else:
+                self._reply(404, {'error': f"Unknown path: {self.path}"})
+
+        def do_POST(self):
+            if self.path != '/analyze':
+                self._reply(404, {'error': f"Unknown path: {self.path}"})
+                return
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                request = json.loads(self.rfile.read(length) or b'{}')
+                analysis = scorer.analyze_text(request['resume_text'], request['job_description'],
+                                               request.get('mode', 'full'))
+            except (KeyError, ValueError) as e:
+                self._reply(400, {'error': str(e)})
+                return
+            self._reply(200, analysis)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ScoringHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-fork resume scoring server")
+    parser.add_argument('--model', default='tfidf', help="bert, tfidf, hashing or hybrid")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--report-interval', type=float, default=60.0,
+                        help="Seconds between memory reports; 0 disables them")
+    parser.add_argument('--fuzzy-distance', type=int, default=0,
+                        help="Count keywords within this many edits of a resume word as matched")
+    args = parser.parse_args()
+
+    # Load once here; every forked worker shares these pages copy-on-write.
+    # Each worker handles one request at a time, so models with per-call state stay safe.
+    scorer = ResumeScorer(args.model, fuzzy_distance=args.fuzzy_distance)
+    server = HTTPServer((args.host, args.port), make_handler(scorer))
+    print(f"Serving {args.model} scoring on {args.host}:{server.server_address[1]} with {args.workers} workers")
+    serve_prefork(server, args.workers, report_interval=args.report_interval)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+
+NUMERIC_COLUMNS = (
+    ('resume', np.int32),
+    ('job', np.int32),
+    ('overall_score', np.float32),
+    ('similarity_score', np.float32),
+    ('coverage_percentage', np.float32),
+    ('matched_keywords', np.int32),
+    ('total_keywords', np.int32)
+)
+
+
+class ResultTable:
+    """Column-oriented store for (resume, job) scoring results.
+
+    Resume ids, job ids and keywords are interned once and referenced by
+    index. Numeric fields live in one NumPy array per column. Missing
+    keywords are stored flat, with an offsets array marking each row's
+    slice. Filtering and sorting work on whole columns, and columns() hands
+    out views rather than copies.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.resume_ids: List[str] = []
+        self.job_ids: List[str] = []
+        self.keywords: List[str] = []
+        self._resume_index: Dict[str, int] = {}
+        self._job_index: Dict[str, int] = {}
+        self._keyword_index: Dict[str, int] = {}
+        self._size = 0
+        self._data = {name: np.zeros(capacity, dtype=dtype) for name, dtype in NUMERIC_COLUMNS}
+        self._missing = np.zeros(capacity * 4, dtype=np.int32)
+        self._missing_size = 0
+        self._offsets = np.zeros(capacity + 1, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _intern(value: str, values: List[str], index: Dict[str, int]) -> int:
+        idx = index.get(value)
+        if idx is None:
+            idx = len(values)
+            values.append(value)
+            index[value] = idx
+        return idx
+
+    def _reserve(self, rows: int, keywords: int) -> None:
+        needed = self._size + rows
+        capacity = len(self._data['resume'])
+        if needed > capacity:
+            capacity = max(needed, capacity * 2)
+            for name in self._data:
+                self._data[name] = np.resize(self._data[name], capacity)
+            self._offsets = np.resize(self._offsets, capacity + 1)
+        needed = self._missing_size + keywords
+        if needed > len(self._missing):
+            self._missing = np.resize(self._missing, max(needed, len(self._missing) * 2))
+
+    def append(self, resume_id: str, job_id: str, overall_score: float, similarity_score: float,
+               coverage_percentage: float = 0.0, matched_keywords: int = 0, total_keywords: int = 0,
+               missing_keywords: Sequence[str] = ()) -> None:
+        self._reserve(1, len(missing_keywords))
+        row = self._size
+        self._data['resume'][row] = self._intern(resume_id, self.resume_ids, self._resume_index)
+        self._data['job'][row] = self._intern(job_id, self.job_ids, self._job_index)
+        self._data['overall_score'][row] = overall_score
+        self._data['similarity_score'][row] = similarity_score
+        self._data['coverage_percentage'][row] = coverage_percentage
+        self._data['matched_keywords'][row] = matched_keywords
+        self._data['total_keywords'][row] = total_keywords
+        
+        for keyword in missing_keywords:
+            self._missing[self._missing_size] = self._intern(keyword, self.keywords, self._keyword_index)
+            self._missing_size += 1
+        self._size += 1
+        self._offsets[self._size] = self._missing_size
+
+    def append_analysis(self, resume_id: str, job_id: str, analysis: Mapping) -> None:
+        # Score-only analyses have no explanation fields; coverage then comes from keyword_score
+        # and the keyword counts stay zero
+        coverage = analysis.get('coverage_stats') or {}
+        coverage_percentage = coverage.get('coverage_percentage')
+        if coverage_percentage is None:
+            coverage_percentage = analysis.get('keyword_score', 0.0) * 100
+        self.append(
+            resume_id, job_id,
+            overall_score=analysis['overall_score'],
+            similarity_score=analysis['similarity_score'],
+            coverage_percentage=coverage_percentage,
+            matched_keywords=coverage.get('matched_keywords', 0),
+            total_keywords=coverage.get('total_keywords', 0),
+            missing_keywords=analysis.get('missing_keywords') or ()
+        )
+
+    def column(self, name: str) -> np.ndarray:
+        return self._data[name][:self._size]
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        return {name: self.column(name) for name, _ in NUMERIC_COLUMNS}
+
+    def missing_keywords(self, row: int) -> List[str]:
+        start, end = self._offsets[row], self._offsets[row + 1]
+        return [self.keywords[k] for k in self._missing[start:end]]
+
+    def take(self, rows: np.ndarray) -> 'ResultTable':
+        """New table with the given rows, sharing the interned id lists"""
+        rows = np.asarray(rows, dtype=np.int64)
+        table = ResultTable(capacity=max(1, len(rows)))
+        table.resume_ids, table._resume_index = self.resume_ids, self._resume_index
+        table.job_ids, table._job_index = self.job_ids, self._job_index
+        table.keywords, table._keyword_index = self.keywords, self._keyword_index
+        for name in self._data:
+            table._data[name] = self.column(name)[rows].copy()
+        
+        starts = self._offsets[rows]
+        lengths = self._offsets[rows + 1] - starts
+        table._offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=table._offsets[1:])
+        if len(rows) and lengths.sum():
+            gather = np.repeat(starts - table._offsets[:-1], lengths) + np.arange(lengths.sum())
+            table._missing = self._missing[gather]
+        else:
+            table._missing = np.zeros(1, dtype=np.int32)
+        table._missing_size = int(lengths.sum())
+        table._size = len(rows)
+        return table
+
+    def filter(self, min_score: Optional[float] = None, job_id: Optional[str] = None,
+               resume_id: Optional[str] = None) -> 'ResultTable':
+        mask = np.ones(self._size, dtype=bool)
+        if min_score is not None:
+            mask &= self.column('overall_score') >= min_score
+        if job_id is not None:
+            mask &= self.column('job') == self._job_index.get(job_id, -1)
+        if resume_id is not None:
+            mask &= self.column('resume') == self._resume_index.get(resume_id, -1)
+        return self.take(np.flatnonzero(mask))
+
+    def sort(self, by: str = 'overall_score', descending: bool = True) -> 'ResultTable':
+        order = np.argsort(self.column(by), kind='stable')
+        return self.take(order[::-1] if descending else order)
+
+    def top_k_per_job(self, k: int) -> Dict[str, List[Tuple[str, float]]]:
+        results = {}
+        jobs = self.column('job')
+        scores = self.column('overall_score')
+        resumes = self.column('resume')
+        for job_idx in np.unique(jobs):
+            rows = np.flatnonzero(jobs == job_idx)
+            best = rows[np.argsort(-scores[rows], kind='stable')[:k]]
+            results[self.job_ids[job_idx]] = [(self.resume_ids[resumes[r]], float(scores[r])) for r in best]
+        return results
+
+    def to_structured(self) -> np.ndarray:
+        array = np.empty(self._size, dtype=[(name, dtype) for name, dtype in NUMERIC_COLUMNS])
+        for name, _ in NUMERIC_COLUMNS:
+            array[name] = self.column(name)
+        return array
+
+    def to_pandas(self):
+        import pandas as pd
+        
+        frame = pd.DataFrame(self.columns(), copy=False)
+        frame['resume'] = pd.Categorical.from_codes(frame['resume'], self.resume_ids)
+        frame['job'] = pd.Categorical.from_codes(frame['job'], self.job_ids)
+        return frame
+
+    def save(self, path: str) -> None:
+        np.savez_compressed(
+            path,
+            missing=self._missing[:self._missing_size],
+            offsets=self._offsets[:self._size + 1],
+            # Fixed-width unicode, so loading never needs pickle
+            resume_ids=np.array(self.resume_ids, dtype=str),
+            job_ids=np.array(self.job_ids, dtype=str),
+            keywords=np.array(self.keywords, dtype=str),
+            **self.columns()
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'ResultTable':
+        with np.load(path, allow_pickle=False) as data:
+            table = cls(capacity=max(1, len(data['resume'])))
+            for name, _ in NUMERIC_COLUMNS:
+                table._data[name] = data[name].copy()
+            table._missing = data['missing'].copy() if len(data['missing']) else np.zeros(1, dtype=np.int32)
+            table._missing_size = len(data['missing'])
+            table._offsets = data['offsets'].copy()
+            table._size = len(data['resume'])
+            table.resume_ids = data['resume_ids'].tolist()
+            table.job_ids = data['job_ids'].tolist()
+            table.keywords = data['keywords'].tolist()
+        table._resume_index = {v: i for i, v in enumerate(table.resume_ids)}
+        table._job_index = {v: i for i, v in enumerate(table.job_ids)}
+        table._keyword_index = {v: i for i, v in enumerate(table.keywords)}
+        return table
+
+    @classmethod
+    def from_analyses(cls, rows: Iterable) -> 'ResultTable':
+        table = cls()
+        for resume_id, job_id, analysis in rows:
+            table.append_analysis(resume_id, job_id, analysis)
+        return table
@@ -1,24 +1,66 @@
-from typing import Dict, List, Tuple
+import argparse
+import glob
+from contextlib import nullcontext
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple
 import numpy as np
 from src.models.bert_model import BertModel
 from src.models.tfidf_model import TfidfModel
+from src.models.hashing_model import HashingModel
+from src.models.hybrid_model import HybridModel
+from src.models.analysis_result import KeywordMatch, build_analysis, overall_score, overall_score_bounds
+from src.models.fuzzy_matcher import FuzzyKeywordMatcher
 from src.preprocessing.resume_parser import ResumeParser
+from src.scoring.result_table import ResultTable
+from src.scoring.section_scorer import SectionScorer
+from src.preprocessing.dedup import deduplicate
+from src.utils.sampling_profiler import SamplingProfiler, add_profile_arguments, run_profiled
+
+
+class ScreenResult(NamedTuple):
+    resume: str
+    job_id: str
+    passed: bool
+    coverage_percentage: float
+    # None when the pair was decided from its bounds without computing similarity
+    overall_score: Optional[float]
+    upper_bound: float
 
 
 class ResumeScorer:
-    def __init__(self, model_type: str = 'bert'):
+    def __init__(self, model_type: str = 'bert', cache_dir: Optional[str] = None,
+                 profiler: Optional[SamplingProfiler] = None, fuzzy_distance: int = 0, **model_options):
         self.model_type = model_type.lower()
+        # When set, extraction and scoring are attributed to their own stages in the profile
+        self.profiler = profiler
         if self.model_type == 'bert':
             self.model = BertModel()
         elif self.model_type == 'tfidf':
             self.model = TfidfModel()
+        elif self.model_type == 'hashing':
+            # model_options: n_features, alternate_sign
+            self.model = HashingModel(**model_options)
+        elif self.model_type == 'hybrid':
+            # model_options: tfidf_weight, bert_weight, cache_size
+            self.model = HybridModel(**model_options)
         else:
             raise ValueError(f"Unsupported model type: {model_type}")
         
-        self.parser = ResumeParser()
+        self.parser = ResumeParser(cache_dir=cache_dir)
+        self.dedup_stats: Dict[str, int] = {}
+        self.screen_stats: Dict[str, int] = {}
+        # Lowest similarity the model can return. TF-IDF cosines are never negative; hashed
+        # features are too unless alternate_sign lets colliding terms cancel into negative weights
+        non_negative = self.model_type == 'tfidf' or (self.model_type == 'hashing' and not self.model.alternate_sign)
+        self.similarity_floor = 0.0 if non_negative else -1.0
+        # Keywords within fuzzy_distance edits of a resume word ("kubernets", "postgresql") count as matched
+        self.fuzzy = FuzzyKeywordMatcher(max_edit_distance=fuzzy_distance) if fuzzy_distance else None
+    
+    def _stage(self, name: str):
+        return self.profiler.stage(name) if self.profiler is not None else nullcontext()
     
-    def analyze_resume(self, resume_path: str, job_description: str) -> Dict:
-        resume_text = self.parser.extract_text(resume_path)
+    def analyze_resume(self, resume_path: str, job_description: str, mode: str = 'full') -> Mapping:
+        with self._stage('extract'):
+            resume_text = self.parser.extract_text(resume_path)
         if not resume_text:
             return {
                 'overall_score': 0,
@@ -30,59 +72,195 @@ class ResumeScorer:
                     'strong_match_percentage': 0,
                     'total_keywords': 0,
                     'matched_keywords': 0,
-                    'strong_matches': 0
+                    'strong_matches': 0,
+                    'fuzzy_matches': 0
                 },
                 'improvement_suggestions': ["Error: Could not extract text from resume"]
             }
         
-        similarity_score = self.model.compute_similarity(resume_text, job_description)
-        missing_keywords = self.model.get_missing_keywords(resume_text, job_description)
-        coverage_stats = self.model.get_keyword_coverage(resume_text, job_description)
-        
-        overall_score = (similarity_score * 0.4 + coverage_stats['coverage_percentage'] / 100 * 0.6) * 100
-        
-        improvement_suggestions = []
-        
-        if missing_keywords:
-            improvement_suggestions.append(f"Add experience with: {', '.join(missing_keywords[:5])}")
-        
-        if coverage_stats['coverage_percentage'] < 70:
-            improvement_suggestions.append("Expand your resume to better match the job requirements")
-        
-        if coverage_stats['strong_match_percentage'] < 30:
-            improvement_suggestions.append("Highlight your relevant experience more prominently")
-        
-        return {
-            'overall_score': overall_score,
-            'similarity_score': similarity_score,
-            'keyword_score': coverage_stats['coverage_percentage'] / 100,
-            'missing_keywords': missing_keywords,
-            'coverage_stats': coverage_stats,
-            'improvement_suggestions': improvement_suggestions
-        }
+        return self.analyze_text(resume_text, job_description, mode)
+    
+    def match_keywords(self, resume_text: str, job_description: str, threshold: float = 0.1) -> List[KeywordMatch]:
+        matches = self.model.match_keywords(resume_text, job_description, threshold)
+        if self.fuzzy is not None:
+            matches = self.fuzzy.apply(matches, resume_text)
+        return matches
+    
+    def get_missing_keywords(self, resume_text: str, job_description: str, threshold: float = 0.1) -> List[str]:
+        matches = self.match_keywords(resume_text, job_description, threshold)
+        return [match.keyword for match in matches if match.missing]
+    
+    def analyze_text(self, resume_text: str, job_description: str, mode: str = 'full') -> Mapping:
+        extra_scores = None
+        with self._stage('similarity'):
+            if self.model_type == 'hybrid':
+                # Keeps the per-model similarities next to the fused score
+                extra_scores = self.model.similarity_components(resume_text, job_description)
+                similarity_score = extra_scores.pop('similarity_score')
+            else:
+                similarity_score = self.model.compute_similarity(resume_text, job_description)
+        with self._stage('keywords'):
+            matches = self.match_keywords(resume_text, job_description)
+        return build_analysis(similarity_score, matches, mode, include_keyword_score=True, extra_scores=extra_scores)
     
     def get_detailed_analysis(self, resume_path: str, job_description: str) -> Dict:
-        resume_data = self.parser.parse_resume(resume_path)
+        with self._stage('extract'):
+            resume_data = self.parser.parse_resume(resume_path)
         if not resume_data:
             return {
                 'error': "Could not parse resume",
                 'analysis': None
             }
         
-        analysis = self.analyze_resume(resume_path, job_description)
+        analysis = self.analyze_text(resume_data['raw_text'], job_description)
         
         return {
             'resume_data': resume_data,
-            'analysis': analysis
+            'analysis': analysis.to_dict()
         }
     
     def compare_resumes(self, resume_paths: List[str], job_description: str) -> List[Tuple[str, float]]:
         resume_scores = []
         
         for resume_path in resume_paths:
-            analysis = self.analyze_resume(resume_path, job_description)
+            analysis = self.analyze_resume(resume_path, job_description, mode='score_only')
             resume_name = resume_path.split('/')[-1]
             resume_scores.append((resume_name, analysis['overall_score']))
         
         resume_scores.sort(key=lambda x: x[1], reverse=True)
-        return resume_scores 
\ No newline at end of file
+        return resume_scores
+    
+    def score_table(self, resume_paths: List[str], job_descriptions: Dict[str, str],
+                    mode: str = 'score_only', dedup_threshold: Optional[float] = None) -> ResultTable:
+        # Bulk scoring into a columnar table instead of one dict per pair
+        table = ResultTable(capacity=max(1, len(resume_paths) * len(job_descriptions)))
+        documents = []
+        for resume_path in resume_paths:
+            with self._stage('extract'):
+                resume_text = self.parser.extract_text(resume_path)
+            if resume_text:
+                # Keyed by the full path; two resumes can share a file name in different directories
+                documents.append((resume_path, resume_text))
+        
+        # Near-duplicate resumes share their cluster representative's scores
+        if dedup_threshold is not None:
+            with self._stage('dedup'):
+                unique, representatives = deduplicate(documents, threshold=dedup_threshold)
+        else:
+            unique, representatives = documents, {path: path for path, _ in documents}
+        
+        analyses = {}
+        for resume_path, resume_text in unique:
+            for job_id, job_description in job_descriptions.items():
+                analyses[resume_path, job_id] = self.analyze_text(resume_text, job_description, mode)
+        
+        for resume_path, _ in documents:
+            for job_id in job_descriptions:
+                table.append_analysis(resume_path, job_id, analyses[representatives[resume_path], job_id])
+        
+        self.dedup_stats = {
+            'documents': len(documents),
+            'clusters': len(unique),
+            'pairs_scored': len(unique) * len(job_descriptions),
+            'pairs_skipped': (len(documents) - len(unique)) * len(job_descriptions)
+        }
+        return table
+    
+    def section_scorer(self, job_descriptions: Dict[str, str], **options) -> SectionScorer:
+        # For edit-and-rescore loops: sections are cached, so only edited sections are recomputed
+        if self.model_type == 'bert':
+            options.setdefault('embedder', self.model.get_embeddings)
+            options.setdefault('tfidf_weight', 0.0)
+            options.setdefault('bert_weight', 1.0)
+        elif self.model_type == 'hybrid' and self.model.bert_weight:
+            options.setdefault('embedder', self.model.bert.get_embeddings)
+            options.setdefault('tfidf_weight', self.model.tfidf_weight)
+            options.setdefault('bert_weight', self.model.bert_weight)
+        return SectionScorer(job_descriptions, parser=self.parser, **options)
+    
+    def screen_text(self, resume_text: str, job_description: str, threshold: float,
+                    resume: str = '', job_id: str = '') -> ScreenResult:
+        with self._stage('keywords'):
+            matches = self.match_keywords(resume_text, job_description)
+        coverage = (sum(1 for match in matches if match.matched) / len(matches) * 100) if matches else 0
+        lower, upper = overall_score_bounds(coverage, self.similarity_floor)
+        
+        # Similarity is only computed when the bounds do not already decide the pair
+        if upper < threshold:
+            self.screen_stats['pruned'] = self.screen_stats.get('pruned', 0) + 1
+            return ScreenResult(resume, job_id, False, coverage, None, upper)
+        if lower >= threshold:
+            self.screen_stats['accepted'] = self.screen_stats.get('accepted', 0) + 1
+            return ScreenResult(resume, job_id, True, coverage, None, upper)
+        
+        with self._stage('similarity'):
+            similarity = self.model.compute_similarity(resume_text, job_description)
+        score = overall_score(similarity, coverage)
+        self.screen_stats['scored'] = self.screen_stats.get('scored', 0) + 1
+        return ScreenResult(resume, job_id, score >= threshold, coverage, score, upper)
+    
+    def screen(self, resume_paths: List[str], job_descriptions: Dict[str, str],
+               threshold: float = 60.0) -> List[ScreenResult]:
+        # Pass/fail against an overall_score cutoff; see screen_stats for how many pairs skipped similarity
+        self.screen_stats = {'pairs': 0, 'pruned': 0, 'accepted': 0, 'scored': 0, 'passed': 0}
+        results = []
+        for resume_path in resume_paths:
+            with self._stage('extract'):
+                resume_text = self.parser.extract_text(resume_path)
+            if not resume_text:
+                continue
+            for job_id, job_description in job_descriptions.items():
+                result = self.screen_text(resume_text, job_description, threshold, resume_path, job_id)
+                self.screen_stats['pairs'] += 1
+                self.screen_stats['passed'] += result.passed
+                results.append(result)
+        return results
+    
+    def analyze_records(self, records: Iterable[Dict], job_description: str,
+                        mode: str = 'full') -> Iterator[Tuple[Dict, Mapping]]:
+        # Records come pre-parsed (see preprocessing.resume_ingestion), so no file is read or re-parsed
+        for record in records:
+            yield record, self.analyze_text(record['raw_text'], job_description, mode) 
+
+
+def load_job_descriptions(csv_path: str) -> Dict[str, str]:
+    import pandas as pd
+    
+    jobs = pd.read_csv(csv_path)
+    title_column = 'title' if 'title' in jobs.columns else 'job_title'
+    return {str(row[title_column]): f"{row['description']} {row.get('required_skills', '')}"
+            for _, row in jobs.iterrows()}
+
+
+def main(args: argparse.Namespace, profiler: Optional[SamplingProfiler] = None) -> None:
+    scorer = ResumeScorer(args.model, profiler=profiler, fuzzy_distance=args.fuzzy_distance)
+    resume_paths = sorted(glob.glob(args.resumes))
+    job_descriptions = load_job_descriptions(args.jobs)
+    table = scorer.score_table(resume_paths, job_descriptions, mode=args.mode,
+                               dedup_threshold=args.dedup_threshold)
+    for job_id, ranked in table.top_k_per_job(args.top_k).items():
+        print(f"{job_id}: " + ', '.join(f"{resume} ({score:.1f})" for resume, score in ranked))
+    if args.output:
+        table.save(args.output)
+        print(f"Saved {len(table)} results to {args.output}")
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description="Score resumes against a job CSV with ResumeScorer")
+    arg_parser.add_argument('resumes', help="Glob of resume .pdf/.txt files")
+    arg_parser.add_argument('jobs', help="Job CSV with title/job_title, description and required_skills")
+    arg_parser.add_argument('--model', default='tfidf', help="bert, tfidf, hashing or hybrid")
+    arg_parser.add_argument('--mode', choices=('full', 'score_only'), default='score_only')
+    arg_parser.add_argument('--dedup-threshold', type=float, default=None)
+    arg_parser.add_argument('--fuzzy-distance', type=int, default=0)
+    arg_parser.add_argument('--top-k', type=int, default=5)
+    arg_parser.add_argument('--output', default=None, help="Save the result table to this .npz file")
+    add_profile_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    
+    if args.profile:
+        # Extraction, similarity, keyword matching and dedup are reported as separate stages
+        run_profiled(lambda profiler: main(args, profiler), args.profile,
+                     args.profile_interval / 1000, args.profile_top)
+    else:
+        main(args)
\ No newline at end of file
@@ -0,0 +1,192 @@
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional
+import numpy as np
+from scipy.sparse import csr_matrix, vstack
+from src.models.analysis_result import AnalysisResult, KeywordMatch, build_analysis, overall_score
+from src.models.incremental_tfidf import IncrementalTfidfVectorizer
+from src.preprocessing.resume_parser import ResumeParser
+
+
+class SectionComponents(NamedTuple):
+    indices: np.ndarray
+    counts: np.ndarray
+    # Dot product of this section's IDF-weighted counts with every job's unit vector
+    job_dots: np.ndarray
+    n_terms: int
+    embedding: Optional[np.ndarray]
+
+
+class SectionScorer:
+    """Scores one resume against a fixed set of jobs, section by section.
+
+    The resume is split with ResumeParser.extract_sections. Each section's
+    term counts, its dot products with every job vector and (optionally) its
+    embedding are cached by a hash of the section text. Term counts add up
+    across sections, so the document vector, its norm, the keyword scores
+    and the per-job cosine are recombined exactly from the cached parts.
+    The document embedding is not: it is the token-weighted average of the
+    section embeddings, an approximation of embedding the whole resume, so
+    the BERT part of the similarity can differ from full-text scoring.
+    After an edit, only the sections whose text changed are vectorized
+    again.
+
+    Keyword matching follows SimplifiedModel: each job's top keywords are its
+    most frequent terms, and a keyword's resume score is its count
+    normalized over the job's vocabulary. Similarity uses the IDF of the job
+    set instead of refitting on each pair. Terms never span two sections.
+    """
+
+    def __init__(self, job_descriptions: Mapping[str, str], parser: Optional[ResumeParser] = None,
+                 embedder: Optional[Callable[[str], np.ndarray]] = None, tfidf_weight: float = 0.5,
+                 bert_weight: float = 0.5, top_keywords: int = 20, threshold: float = 0.1,
+                 cache_size: int = 4096):
+        self.parser = parser or ResumeParser()
+        self.embedder = embedder
+        if embedder is not None:
+            total = tfidf_weight + bert_weight
+            if tfidf_weight < 0 or bert_weight < 0 or total <= 0:
+                raise ValueError("Section scorer weights must be non-negative and not both zero")
+            self.tfidf_weight, self.bert_weight = tfidf_weight / total, bert_weight / total
+        else:
+            self.tfidf_weight, self.bert_weight = 1.0, 0.0
+        self.threshold = threshold
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[str, SectionComponents]' = OrderedDict()
+        self.stats = {'sections': 0, 'reused': 0, 'computed': 0}
+        self.last_sections: Dict[str, str] = {}
+        self._last: Optional[Dict[str, np.ndarray]] = None
+
+        # The jobs are the corpus: they fix the vocabulary and the IDF
+        self.job_ids = list(job_descriptions)
+        self.vectorizer = IncrementalTfidfVectorizer(ngram_range=(1, 2))
+        for job_id in self.job_ids:
+            self.vectorizer.add_document(job_id, self.preprocess_text(job_descriptions[job_id]))
+        self.idf = self.vectorizer.idf_
+        width = len(self.vectorizer.vocabulary_)
+        if self.job_ids:
+            job_matrix = vstack([self.vectorizer.vector(job_id) for job_id in self.job_ids])
+        else:
+            job_matrix = csr_matrix((0, width))
+        # Column-major, so a section only touches the columns of its own terms
+        self.job_matrix = job_matrix.tocsc()
+        # Which terms each job contains, for the per-job keyword normalization
+        self.job_terms = self.job_matrix.copy()
+        self.job_terms.data[:] = 1.0
+
+        terms = np.empty(width, dtype=object)
+        for term, idx in self.vectorizer.vocabulary_.items():
+            terms[idx] = term
+        self.terms = terms
+        self.keyword_index = np.full((len(self.job_ids), top_keywords), -1, dtype=np.int64)
+        for row, job_id in enumerate(self.job_ids):
+            indices, counts = self.vectorizer.term_counts(job_id)
+            order = sorted(range(len(indices)), key=lambda i: (-counts[i], terms[indices[i]]))[:top_keywords]
+            self.keyword_index[row, :len(order)] = indices[order]
+
+        self.job_embeddings = None
+        if embedder is not None and self.job_ids:
+            embeddings = np.vstack([embedder(job_descriptions[job_id]) for job_id in self.job_ids])
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            self.job_embeddings = embeddings / np.where(norms > 0, norms, 1)
+
+    @staticmethod
+    def preprocess_text(text: str) -> str:
+        text = re.sub(r'[^a-zA-Z\s]', ' ', text)
+        return ' '.join(text.lower().split())
+
+    @staticmethod
+    def section_hash(text: str) -> str:
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def _components(self, text: str) -> SectionComponents:
+        key = self.section_hash(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.stats['reused'] += 1
+            return cached
+
+        processed = self.preprocess_text(text)
+        indices, counts = self.vectorizer.count(processed)
+        job_dots = self.job_matrix[:, indices] @ (counts * self.idf[indices])
+        embedding = self.embedder(text) if self.embedder is not None else None
+        components = SectionComponents(indices, counts, job_dots, len(processed.split()), embedding)
+
+        self._cache[key] = components
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        self.stats['computed'] += 1
+        return components
+
+    def rescore(self, resume: object) -> Dict[str, np.ndarray]:
+        # Takes resume text or an extract_sections() dict; returns arrays aligned with self.job_ids
+        sections = self.parser.extract_sections(resume) if isinstance(resume, str) else dict(resume)
+        self.stats = {'sections': len(sections), 'reused': 0, 'computed': 0}
+        parts = [self._components(text) for text in sections.values()]
+        self.last_sections = sections
+
+        n_jobs = len(self.job_ids)
+        counts = np.zeros(len(self.idf))
+        job_dots = np.zeros(n_jobs)
+        for part in parts:
+            np.add.at(counts, part.indices, part.counts)
+            job_dots += part.job_dots
+
+        norm = np.linalg.norm(counts * self.idf)
+        tfidf_similarity = job_dots / norm if norm > 0 else np.zeros(n_jobs)
+
+        if self.job_embeddings is not None:
+            weights = np.array([part.n_terms for part in parts], dtype=np.float64)
+            if weights.sum() > 0:
+                embedding = np.average(np.vstack([part.embedding for part in parts]), axis=0, weights=weights)
+                embedding_norm = np.linalg.norm(embedding)
+                bert_similarity = self.job_embeddings @ embedding / embedding_norm if embedding_norm > 0 else np.zeros(n_jobs)
+            else:
+                bert_similarity = np.zeros(n_jobs)
+            similarity = self.tfidf_weight * tfidf_similarity + self.bert_weight * bert_similarity
+        else:
+            bert_similarity = None
+            similarity = tfidf_similarity
+
+        # Keyword score: the keyword's count normalized over the terms the resume shares with that job
+        present = np.flatnonzero(counts)
+        job_norms = np.sqrt(self.job_terms[:, present] @ (counts[present] ** 2))
+        valid = self.keyword_index >= 0
+        keyword_counts = np.where(valid, counts[np.maximum(self.keyword_index, 0)], 0.0)
+        keyword_scores = keyword_counts / np.where(job_norms > 0, job_norms, 1)[:, None]
+        n_keywords = valid.sum(axis=1)
+        matched = (keyword_scores > 0) & valid
+        coverage = np.divide(matched.sum(axis=1) * 100.0, n_keywords,
+                             out=np.zeros(n_jobs), where=n_keywords > 0)
+
+        self._last = {
+            'overall_score': overall_score(similarity, coverage),
+            'similarity_score': similarity,
+            'keyword_score': coverage / 100,
+            'tfidf_similarity': tfidf_similarity,
+            'keyword_scores': keyword_scores
+        }
+        if bert_similarity is not None:
+            self._last['bert_similarity'] = bert_similarity
+        return self._last
+
+    def analysis(self, job_id: str, mode: str = 'full') -> AnalysisResult:
+        # Detailed analysis for one job from the last rescore()
+        if self._last is None:
+            raise ValueError("rescore() has not been called yet")
+        row = self.job_ids.index(job_id)
+        matches: List[KeywordMatch] = []
+        for idx, score in zip(self.keyword_index[row], self._last['keyword_scores'][row]):
+            if idx < 0:
+                continue
+            matches.append(KeywordMatch(self.terms[idx], score > 0, score > 0.5, score < self.threshold))
+        extra = {'tfidf_similarity': float(self._last['tfidf_similarity'][row])}
+        if 'bert_similarity' in self._last:
+            extra['bert_similarity'] = float(self._last['bert_similarity'][row])
+        return build_analysis(float(self._last['similarity_score'][row]), matches, mode,
+                              include_keyword_score=True, extra_scores=extra)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
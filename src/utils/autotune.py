@@ -0,0 +1,133 @@
+import argparse
+import glob
+import itertools
+import multiprocessing
+import os
+import time
+from typing import Dict, List, Optional
+import numpy as np
+from src.models.runtime_profile import save_runtime_profile, profile_path
+
+
+def load_sample(source: str, sample_size: int) -> List[str]:
+    paths = sorted(glob.glob(os.path.join(source, '*.txt')) if os.path.isdir(source) else glob.glob(source))
+    texts = []
+    for path in paths[:sample_size]:
+        with open(path, 'r', encoding='utf-8') as f:
+            texts.append(f.read())
+    return texts
+
+
+def _trial_worker(texts: List[str], config: Dict, barrier, results) -> None:
+    # Runs in a fresh process so inter-op threads can still be configured
+    from src.models.bert_model import BertModel
+    
+    model = BertModel(profile=config)
+    model.get_embeddings_batch(texts[:config['batch_size']])  # warm-up
+    barrier.wait()
+    
+    latencies = []
+    start = time.perf_counter()
+    for i in range(0, len(texts), config['batch_size']):
+        batch_start = time.perf_counter()
+        model.get_embeddings_batch(texts[i:i + config['batch_size']])
+        latencies.append(time.perf_counter() - batch_start)
+    results.put({'elapsed': time.perf_counter() - start, 'documents': len(texts), 'latencies': latencies})
+
+
+def run_trial(texts: List[str], config: Dict, timeout: float = 600.0) -> Optional[Dict]:
+    ctx = multiprocessing.get_context('spawn')
+    workers = config['workers']
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    shards = [texts[i::workers] for i in range(workers)]
+    processes = [ctx.Process(target=_trial_worker, args=(shard, config, barrier, results)) for shard in shards]
+    for process in processes:
+        process.start()
+    
+    try:
+        reports = [results.get(timeout=timeout) for _ in processes]
+    except Exception as e:
+        print(f"Trial {config} failed: {e}")
+        reports = None
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+    if reports is None:
+        return None
+    
+    elapsed = max(report['elapsed'] for report in reports)
+    latencies = [latency for report in reports for latency in report['latencies']]
+    return {
+        'docs_per_second': sum(report['documents'] for report in reports) / elapsed if elapsed > 0 else 0.0,
+        'batch_latency_p50': float(np.percentile(latencies, 50)),
+        'batch_latency_p95': float(np.percentile(latencies, 95))
+    }
+
+
+def candidate_configs(cpu_count: int, batch_sizes: List[int], max_workers: int) -> List[Dict]:
+    thread_options = sorted({1, 2, 4, 8, 16, cpu_count} & set(range(1, cpu_count + 1)))
+    configs = []
+    for workers, intra, inter, batch_size in itertools.product(
+            range(1, max_workers + 1), thread_options, [1, 2], batch_sizes):
+        # Never oversubscribe the cores
+        if workers * intra > cpu_count:
+            continue
+        configs.append({'workers': workers, 'intra_op_threads': intra,
+                        'inter_op_threads': inter, 'batch_size': batch_size})
+    return configs
+
+
+def autotune(texts: List[str], batch_sizes: List[int], max_workers: int) -> Dict:
+    cpu_count = os.cpu_count() or 1
+    best = None
+    trials = []
+    for config in candidate_configs(cpu_count, batch_sizes, max_workers):
+        metrics = run_trial(texts, config)
+        if metrics is None:
+            continue
+        trials.append({**config, **metrics})
+        print(f"workers={config['workers']} intra={config['intra_op_threads']} inter={config['inter_op_threads']} "
+              f"batch={config['batch_size']}: {metrics['docs_per_second']:.1f} docs/s, "
+              f"p95 batch latency {metrics['batch_latency_p95'] * 1000:.0f} ms")
+        if best is None or metrics['docs_per_second'] > best['docs_per_second']:
+            best = trials[-1]
+    
+    if best is None:
+        raise RuntimeError("No autotune trial completed")
+    return {
+        'intra_op_threads': best['intra_op_threads'],
+        'inter_op_threads': best['inter_op_threads'],
+        'batch_size': best['batch_size'],
+        'workers': best['workers'],
+        'docs_per_second': best['docs_per_second'],
+        'cpu_count': cpu_count,
+        'sample_size': len(texts),
+        'trials': trials
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the fastest torch threading and batch settings for BertModel")
+    parser.add_argument('--source', default='data/raw/resumes_txt', help="Directory or glob of resume .txt files")
+    parser.add_argument('--sample-size', type=int, default=64)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 4, 8, 16, 32])
+    parser.add_argument('--max-workers', type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument('--output', default=None, help=f"Profile path (default: {profile_path()})")
+    args = parser.parse_args()
+    
+    texts = load_sample(args.source, args.sample_size)
+    if not texts:
+        print(f"No resume text found in {args.source}")
+        return
+    
+    profile = autotune(texts, args.batch_sizes, args.max_workers)
+    path = save_runtime_profile(profile, args.output)
+    print(f"Best: {profile['docs_per_second']:.1f} docs/s with workers={profile['workers']}, "
+          f"intra={profile['intra_op_threads']}, inter={profile['inter_op_threads']}, batch={profile['batch_size']}")
+    print(f"Saved profile to {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,25 +1,19 @@
 import os
-from fpdf import FPDF
-from typing import Optional
-
-def convert_text_to_pdf(text: str, output_path: str) -> bool:
-    try:
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        lines = text.split('\n')
-        for line in lines:
-            pdf.cell(200, 10, txt=line, ln=1, align='L')
-        
-        pdf.output(output_path)
-        return True
-    
-    except Exception as e:
-        print(f"Error converting text to PDF: {e}")
-        return False
+import argparse
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .text_to_pdf import DEFAULT_TEMPLATE, PdfTemplate, convert_text_to_pdf
 
-def convert_all_resumes(input_dir: str, output_dir: str) -> None:
+def convert_all_resumes(input_dir: str, output_dir: str, workers: Optional[int] = None,
+                        shard_size: Optional[int] = None) -> None:
+    # workers switches to the bulk renderer; the default stays one file at a time
+    if workers:
+        render_corpus(iter_text_files(input_dir), output_dir, workers=workers, shard_size=shard_size)
+        return
+    
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
@@ -34,4 +28,108 @@ def convert_all_resumes(input_dir: str, output_dir: str) -> None:
             if convert_text_to_pdf(text, output_path):
                 print(f"Successfully converted {filename} to PDF")
             else:
-                print(f"Failed to convert {filename} to PDF") 
\ No newline at end of file
+                print(f"Failed to convert {filename} to PDF")
+
+def iter_text_files(input_dir: str) -> Iterator[Tuple[str, str]]:
+    for filename in sorted(os.listdir(input_dir)):
+        if filename.endswith('.txt'):
+            with open(os.path.join(input_dir, filename), 'r', encoding='utf-8') as file:
+                yield os.path.splitext(filename)[0], file.read()
+
+_template: PdfTemplate = DEFAULT_TEMPLATE
+
+def _init_renderer(template: PdfTemplate) -> None:
+    # The template is sent once per worker, not once per document
+    global _template
+    _template = template
+
+def _render_chunk(chunk: List[Tuple[str, str, str]]) -> List[Dict]:
+    rows = []
+    for doc_id, text, output_path in chunk:
+        try:
+            pages = _template.write(text, output_path)
+            rows.append({'id': doc_id, 'path': output_path, 'pages': pages, 'bytes': os.path.getsize(output_path)})
+        except Exception as e:
+            rows.append({'id': doc_id, 'path': output_path, 'error': str(e)})
+    return rows
+
+def _chunks(documents: Iterable[Tuple[str, str]], output_dir: str, shard_size: Optional[int],
+            chunk_size: int) -> Iterator[List[Tuple[str, str, str]]]:
+    made = set()
+    iterator = enumerate(documents)
+    while True:
+        chunk = []
+        for index, (doc_id, text) in islice(iterator, chunk_size):
+            directory = os.path.join(output_dir, f"shard-{index // shard_size:05d}") if shard_size else output_dir
+            if directory not in made:
+                os.makedirs(directory, exist_ok=True)
+                made.add(directory)
+            chunk.append((doc_id, text, os.path.join(directory, f"{doc_id}.pdf")))
+        if not chunk:
+            return
+        yield chunk
+
+def render_corpus(documents: Iterable[Tuple[str, str]], output_dir: str, workers: Optional[int] = None,
+                  shard_size: Optional[int] = 1000, chunk_size: int = 32,
+                  template: Optional[PdfTemplate] = None) -> Dict[str, float]:
+    """Render (id, text) pairs to PDFs in a process pool.
+    
+    Documents are read lazily from the iterator, with at most two chunks in
+    flight per worker. Output goes to shard-NNNNN directories of shard_size
+    files, or flat into output_dir when shard_size is None. Every rendered
+    file is listed in output_dir/manifest.jsonl.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    stats = {'documents': 0, 'pages': 0, 'bytes': 0, 'errors': 0}
+    start = time.perf_counter()
+    
+    with open(os.path.join(output_dir, 'manifest.jsonl'), 'w') as manifest, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_renderer,
+                                initargs=(template or DEFAULT_TEMPLATE,)) as executor:
+        def collect(futures) -> None:
+            for future in futures:
+                for row in future.result():
+                    if 'error' in row:
+                        print(f"Failed to convert {row['id']} to PDF: {row['error']}")
+                        stats['errors'] += 1
+                        continue
+                    stats['documents'] += 1
+                    stats['pages'] += row['pages']
+                    stats['bytes'] += row['bytes']
+                    manifest.write(json.dumps(row) + '\n')
+        
+        pending = set()
+        for chunk in _chunks(documents, output_dir, shard_size, chunk_size):
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(executor.submit(_render_chunk, chunk))
+        collect(pending)
+    
+    stats['seconds'] = time.perf_counter() - start
+    stats['pages_per_second'] = stats['pages'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+    print(f"Rendered {stats['documents']} PDFs ({stats['pages']} pages, {stats['bytes'] / 1e6:.1f} MB) "
+          f"in {stats['seconds']:.2f}s: {stats['pages_per_second']:.1f} pages/s with {workers} workers")
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Render resume text to a PDF corpus")
+    parser.add_argument('source', help="Directory of .txt resumes, or resume JSON/JSONL file, directory or glob with --json")
+    parser.add_argument('output_dir')
+    parser.add_argument('--json', action='store_true', help="Read resumes through preprocessing.resume_ingestion")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--shard-size', type=int, default=1000, help="PDFs per shard directory; 0 writes flat")
+    parser.add_argument('--chunk-size', type=int, default=32, help="Documents per worker task")
+    args = parser.parse_args()
+    
+    if args.json:
+        from src.preprocessing.resume_ingestion import iter_resumes
+        documents = ((record['id'], record['raw_text']) for record in iter_resumes(args.source))
+    else:
+        documents = iter_text_files(args.source)
+    render_corpus(documents, args.output_dir, workers=args.workers, shard_size=args.shard_size or None,
+                  chunk_size=args.chunk_size)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
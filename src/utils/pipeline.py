@@ -0,0 +1,156 @@
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+
+class Step:
+    def __init__(self, name: str, func: Callable[[], None], inputs: List[str], outputs: List[str],
+                 lock: Optional[threading.Lock] = None):
+        self.name = name
+        self.func = func
+        self.inputs = inputs
+        self.outputs = outputs
+        # Steps sharing a lock (e.g. a model with mutable state) never run at the same time
+        self.lock = lock
+
+
+def hash_paths(paths: List[str]) -> Optional[str]:
+    # Content hash over files, glob patterns and directory trees; None if any plain path is missing
+    expanded = []
+    for path in paths:
+        if glob.has_magic(path):
+            expanded.extend(glob.glob(path))
+        elif not os.path.exists(path):
+            return None
+        else:
+            expanded.append(path)
+
+    digest = hashlib.sha256()
+    for path in sorted(expanded):
+        if os.path.isdir(path):
+            files = []
+            for root, _, filenames in os.walk(path):
+                files.extend(os.path.join(root, filename) for filename in filenames)
+        else:
+            files = [path]
+
+        for file_path in sorted(files):
+            digest.update(file_path.encode('utf-8'))
+            with open(file_path, 'rb') as file:
+                for chunk in iter(lambda: file.read(1 << 20), b''):
+                    digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Pipeline:
+    def __init__(self, steps: List[Step], state_file: str = '.pipeline_state.json', max_workers: int = 4):
+        self.steps = {step.name: step for step in steps}
+        self.state_file = state_file
+        self.max_workers = max_workers
+        self.timings: Dict[str, float] = {}
+        self.wall_time = 0.0
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict[str, str]:
+        if not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable pipeline state {self.state_file}: {e}")
+            return {}
+
+    def _save_state(self) -> None:
+        with open(self.state_file, 'w') as f:
+            json.dump(self.state, f, indent=2)
+
+    @staticmethod
+    def _produces(output: str, inp: str) -> bool:
+        output = output.rstrip('/')
+        return (inp == output or inp.startswith(output + '/')
+                or fnmatch.fnmatch(output, inp) or output.startswith(inp.rstrip('/') + '/'))
+
+    def dependencies(self, step: Step) -> List[str]:
+        deps = []
+        for other in self.steps.values():
+            if other is step:
+                continue
+            for output in other.outputs:
+                if any(self._produces(output, inp) for inp in step.inputs):
+                    deps.append(other.name)
+                    break
+        return deps
+
+    def is_up_to_date(self, step: Step, input_hash: Optional[str]) -> bool:
+        recorded = self.state.get(step.name)
+        if not recorded or not all(os.path.exists(output) for output in step.outputs):
+            return False
+        return recorded == input_hash
+
+    def _run_step(self, step: Step, force: bool) -> str:
+        input_hash = hash_paths(step.inputs)
+        if not force and self.is_up_to_date(step, input_hash):
+            self.timings[step.name] = 0.0
+            return 'skipped'
+
+        start = time.perf_counter()
+        if step.lock is not None:
+            with step.lock:
+                step.func()
+        else:
+            step.func()
+        self.timings[step.name] = time.perf_counter() - start
+
+        self.state[step.name] = input_hash
+        return 'ran'
+
+    def run(self, force: bool = False) -> bool:
+        deps = {name: set(self.dependencies(step)) for name, step in self.steps.items()}
+        done = set()
+        pending = dict(self.steps)
+        ok = True
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while pending or running:
+                for name in [n for n in pending if deps[n] <= done]:
+                    step = pending.pop(name)
+                    print(f"Running: {name}")
+                    running[executor.submit(self._run_step, step, force)] = name
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        status = future.result()
+                    except Exception as e:
+                        print(f"Error running step {name}: {e}")
+                        ok = False
+                        pending.clear()
+                        continue
+                    print(f"Finished: {name} ({status}, {self.timings[name]:.2f}s)")
+                    done.add(name)
+
+        self.wall_time = time.perf_counter() - start
+        self._save_state()
+        return ok
+
+    def report(self) -> str:
+        lines = ["Step timings:"]
+        for name in self.steps:
+            if name in self.timings:
+                lines.append(f"- {name}: {self.timings[name]:.2f}s")
+        lines.append(f"Total step time: {sum(self.timings.values()):.2f}s")
+        lines.append(f"Wall time: {self.wall_time:.2f}s")
+        return '\n'.join(lines)
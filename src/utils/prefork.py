@@ -0,0 +1,189 @@
+import gc
+import multiprocessing
+import os
+import queue
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+# Pre-fork workers: load models once in the parent, then fork. The children
+# share the parent's pages copy-on-write, so N workers cost one copy of the
+# weights plus whatever each worker writes to.
+
+
+def prefork_available() -> bool:
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def memory_usage(pid: Optional[int] = None) -> Dict[str, int]:
+    # Bytes from /proc; PSS splits shared pages between the processes mapping them
+    pid = pid or os.getpid()
+    usage = {'rss': 0, 'pss': 0, 'private': 0, 'shared': 0}
+    fields = {'Rss': 'rss', 'Pss': 'pss', 'Private_Clean': 'private', 'Private_Dirty': 'private',
+              'Shared_Clean': 'shared', 'Shared_Dirty': 'shared'}
+    try:
+        with open(f'/proc/{pid}/smaps_rollup', 'r') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].rstrip(':') in fields:
+                    usage[fields[parts[0].rstrip(':')]] += int(parts[1]) * 1024
+    except OSError:
+        pass
+    return usage
+
+
+def memory_report(parent_pid: int, worker_pids: List[int]) -> str:
+    mb = 1024 * 1024
+    parent = memory_usage(parent_pid)
+    workers = {pid: memory_usage(pid) for pid in worker_pids}
+    lines = [f"Pre-fork workers: {len(worker_pids)}",
+             f"Parent {parent_pid}: RSS {parent['rss'] / mb:.1f} MB"]
+    for pid, usage in workers.items():
+        lines.append(f"Worker {pid}: RSS {usage['rss'] / mb:.1f} MB, PSS {usage['pss'] / mb:.1f} MB, "
+                     f"private {usage['private'] / mb:.1f} MB, shared {usage['shared'] / mb:.1f} MB")
+    if workers:
+        private = sum(usage['private'] for usage in workers.values()) / len(workers)
+        rss = sum(usage['rss'] for usage in workers.values()) / len(workers)
+        total = parent['pss'] + sum(usage['pss'] for usage in workers.values())
+        lines.append(f"Memory per worker: {private / mb:.1f} MB private of {rss / mb:.1f} MB RSS")
+        lines.append(f"Total (PSS, parent + workers): {total / mb:.1f} MB; "
+                     f"unshared workers would need about {(parent['rss'] + rss * len(workers)) / mb:.1f} MB")
+    return '\n'.join(lines)
+
+
+def _fork(ctx, target: Callable, args: tuple):
+    # Objects alive at fork time move to the permanent generation, so the
+    # collector never writes to (and un-shares) their pages in the children
+    gc.collect()
+    gc.freeze()
+    try:
+        process = ctx.Process(target=target, args=args, daemon=True)
+        process.start()
+    finally:
+        gc.unfreeze()
+    return process
+
+
+def _worker_loop(func: Callable[[Any], Any], worker_init: Optional[Callable[[], None]],
+                 tasks, results) -> None:
+    if worker_init is not None:
+        worker_init()
+    while True:
+        item = tasks.get()
+        if item is None:
+            return
+        try:
+            results.put((True, func(item)))
+        except Exception as e:
+            results.put((False, f"{type(e).__name__}: {e}"))
+
+
+class PreforkPool:
+    """Process pool whose workers are forked from an already-loaded parent.
+
+    Whatever `func` reads (module globals, closures) must be loaded before
+    the first task is submitted. Tasks and results still go through pickling
+    queues. The models themselves are never pickled.
+    """
+
+    def __init__(self, func: Callable[[Any], Any], workers: int,
+                 worker_init: Optional[Callable[[], None]] = None):
+        if not prefork_available():
+            raise RuntimeError("Pre-fork workers need the 'fork' start method")
+        self.func = func
+        self.workers = max(1, int(workers))
+        self.worker_init = worker_init
+        self._ctx = multiprocessing.get_context('fork')
+        self._tasks = None
+        self._results = None
+        self._processes: List = []
+
+    def start(self) -> None:
+        if self._processes:
+            return
+        self._tasks = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self._processes = [_fork(self._ctx, _worker_loop, (self.func, self.worker_init, self._tasks, self._results))
+                           for _ in range(self.workers)]
+
+    def imap_unordered(self, tasks: Iterable[Any]) -> Iterator[Any]:
+        self.start()
+        submitted = 0
+        for task in tasks:
+            self._tasks.put(task)
+            submitted += 1
+
+        received = 0
+        while received < submitted:
+            try:
+                ok, value = self._results.get(timeout=1.0)
+            except queue.Empty:
+                dead = [process for process in self._processes if not process.is_alive()]
+                if dead:
+                    raise RuntimeError(f"Pre-fork worker {dead[0].pid} exited with code {dead[0].exitcode}")
+                continue
+            received += 1
+            if ok:
+                yield value
+            else:
+                print(f"Error in pre-fork worker: {value}")
+
+    def worker_pids(self) -> List[int]:
+        return [process.pid for process in self._processes if process.is_alive()]
+
+    def report(self) -> str:
+        return memory_report(os.getpid(), self.worker_pids())
+
+    def close(self) -> None:
+        for _ in self._processes:
+            self._tasks.put(None)
+        for process in self._processes:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+    def __enter__(self) -> 'PreforkPool':
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _serve(server, worker_init: Optional[Callable[[], None]]) -> None:
+    if worker_init is not None:
+        worker_init()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+def serve_prefork(server, workers: int, worker_init: Optional[Callable[[], None]] = None,
+                  report_interval: float = 60.0) -> None:
+    # The parent binds the socket and loads the model; each child accepts on the shared socket
+    if not prefork_available():
+        raise RuntimeError("Pre-fork serving needs the 'fork' start method")
+    ctx = multiprocessing.get_context('fork')
+    processes = [_fork(ctx, _serve, (server, worker_init)) for _ in range(max(1, int(workers)))]
+    print(memory_report(os.getpid(), [process.pid for process in processes]))
+
+    last_report = time.monotonic()
+    try:
+        while True:
+            time.sleep(1.0)
+            for index, process in enumerate(processes):
+                if not process.is_alive():
+                    print(f"Pre-fork worker {process.pid} exited with code {process.exitcode}; restarting")
+                    processes[index] = _fork(ctx, _serve, (server, worker_init))
+            if report_interval and time.monotonic() - last_report >= report_interval:
+                print(memory_report(os.getpid(), [process.pid for process in processes]))
+                last_report = time.monotonic()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(timeout=10)
+        server.server_close()
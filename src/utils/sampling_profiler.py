@@ -0,0 +1,188 @@
+import argparse
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_INTERVAL = 0.005
+DEFAULT_TOP = 15
+
+# Thread names like "reader-0" (see utils.staged_pipeline) map to the stage "reader"
+_THREAD_SUFFIX = re.compile(r'-\d+$')
+
+# A sample whose innermost frame is in one of these files is a thread blocked on a lock, queue or socket
+IDLE_FILES = ('threading.py', 'queue.py', 'selectors.py', 'socketserver.py')
+
+
+def is_idle(frames: Tuple[str, ...]) -> bool:
+    return bool(frames) and frames[-1].rsplit('(', 1)[-1].split(':')[0] in IDLE_FILES
+
+
+class SamplingProfiler:
+    """Statistical profiler that samples every thread's stack on a fixed interval.
+
+    A background thread reads sys._current_frames() every `interval`
+    seconds, so the profiled code runs at full speed between samples. Each
+    sample is attributed to a stage. The stage is the innermost stage()
+    block active on that thread, or else the thread's name without its
+    worker number.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, max_depth: int = 128):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples: Counter = Counter()
+        self.total_samples = 0
+        self.wall_time = 0.0
+        self._labels: Dict[object, str] = {}
+        self._stages: Dict[int, List[str]] = defaultdict(list)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, 'co_qualname', code.co_name)
+            label = f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def _stage_for(self, ident: int, names: Dict[int, str]) -> str:
+        stack = self._stages.get(ident)
+        if stack:
+            try:
+                return stack[-1]
+            except IndexError:
+                pass
+        name = names.get(ident, 'thread')
+        return 'main' if name == 'MainThread' else _THREAD_SUFFIX.sub('', name)
+
+    def _sample(self) -> None:
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            frames = []
+            while frame is not None and len(frames) < self.max_depth:
+                frames.append(self._label(frame.f_code))
+                frame = frame.f_back
+            frames.reverse()
+            self.samples[(self._stage_for(ident, names),) + tuple(frames)] += 1
+            self.total_samples += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.wall_time += time.perf_counter() - self._started
+
+    def __enter__(self) -> 'SamplingProfiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        stack = self._stages[threading.get_ident()]
+        stack.append(name)
+        try:
+            yield
+        finally:
+            stack.pop()
+
+    def stage_names(self) -> List[str]:
+        totals = Counter()
+        for stack, count in self.samples.items():
+            totals[stack[0]] += count
+        return [name for name, _ in totals.most_common()]
+
+    def collapsed(self) -> List[str]:
+        # One "stage;outer;...;inner count" line per distinct stack (flamegraph.pl / speedscope input)
+        return [f"{';'.join(stack)} {count}" for stack, count in sorted(self.samples.items())]
+
+    def write_collapsed(self, path: str) -> str:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            f.write('\n'.join(self.collapsed()) + '\n')
+        return path
+
+    def top_functions(self, stage: Optional[str] = None, n: int = DEFAULT_TOP) -> List[Tuple[str, int, int]]:
+        # (function, self samples, total samples) over active samples; total counts a function once per sample
+        own = Counter()
+        total = Counter()
+        for stack, count in self.samples.items():
+            if stage is not None and stack[0] != stage:
+                continue
+            frames = stack[1:]
+            if not frames or is_idle(frames):
+                continue
+            own[frames[-1]] += count
+            for frame in set(frames):
+                total[frame] += count
+        ranked = sorted(total, key=lambda frame: (own[frame], total[frame]), reverse=True)
+        return [(frame, own[frame], total[frame]) for frame in ranked[:n]]
+
+    def report(self, n: int = DEFAULT_TOP) -> str:
+        lines = [f"Sampling profile: {self.total_samples} samples every {self.interval * 1000:.1f}ms "
+                 f"over {self.wall_time:.2f}s"]
+        for stage in self.stage_names():
+            stage_samples = sum(count for stack, count in self.samples.items() if stack[0] == stage)
+            idle = sum(count for stack, count in self.samples.items() if stack[0] == stage and is_idle(stack[1:]))
+            lines.append(f"\nStage {stage} ({stage_samples} samples, {idle / stage_samples * 100:.1f}% waiting)")
+            active = stage_samples - idle
+            if not active:
+                continue
+            # Percentages are of the stage's active (non-waiting) samples
+            lines.append(f"{'self%':>7} {'total%':>7}  function")
+            for frame, own, total in self.top_functions(stage, n):
+                lines.append(f"{own / active * 100:>6.1f}% {total / active * 100:>6.1f}%  {frame}")
+        return '\n'.join(lines)
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--profile', nargs='?', const='output/profile/profile', default=None, metavar='PREFIX',
+                        help="Sample the run and write PREFIX.collapsed and PREFIX_top.txt")
+    parser.add_argument('--profile-interval', type=float, default=DEFAULT_INTERVAL * 1000,
+                        help="Sampling interval in milliseconds")
+    parser.add_argument('--profile-top', type=int, default=DEFAULT_TOP,
+                        help="Functions listed per stage in the hot-function table")
+
+
+def run_profiled(func: Callable[[SamplingProfiler], None], prefix: str, interval: float = DEFAULT_INTERVAL,
+                 top: int = DEFAULT_TOP) -> SamplingProfiler:
+    # func gets the profiler so it can hand it on, e.g. ResumeScorer(profiler=...) for per-stage labels
+    profiler = SamplingProfiler(interval=interval)
+    with profiler:
+        func(profiler)
+
+    report = profiler.report(top)
+    profiler.write_collapsed(prefix + '.collapsed')
+    with open(prefix + '_top.txt', 'w') as f:
+        f.write(report + '\n')
+    print(report)
+    print(f"Wrote {prefix}.collapsed and {prefix}_top.txt")
+    return profiler
@@ -0,0 +1,144 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Marks the end of the stream; one is sent per worker of the next stage
+_DONE = object()
+
+
+class Stage:
+    def __init__(self, name: str, func: Callable[[Any], Any], workers: int = 1, queue_size: int = 32):
+        # func returns the item for the next stage; returning None drops the item
+        self.name = name
+        self.func = func
+        self.workers = max(1, int(workers))
+        self.queue_size = max(1, int(queue_size))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.busy_time = 0.0
+        # Time spent waiting on a full downstream queue (backpressure)
+        self.blocked_time = 0.0
+
+    def utilization(self, wall_time: float) -> float:
+        if wall_time <= 0:
+            return 0.0
+        return self.busy_time / (wall_time * self.workers)
+
+
+class StagedPipeline:
+    """Chain of stages connected by bounded queues, each stage with its own worker threads.
+
+    Stages overlap: while one resume is being scored, the reader can already
+    load the next files and the writer can flush earlier results. Queues
+    are bounded, so a slow stage makes its producers block instead of
+    buffering the whole input in memory.
+
+    Workers are threads. I/O stages release the GIL while they block, which
+    is what keeps the scoring stage busy. A stage whose func uses shared
+    mutable state (e.g. one model instance) should run with one worker or
+    give each thread its own copy.
+    """
+
+    def __init__(self, stages: List[Stage]):
+        if not stages:
+            raise ValueError("A staged pipeline needs at least one stage")
+        self.stages = stages
+        self.wall_time = 0.0
+        self.source_blocked_time = 0.0
+        self.source_items = 0
+
+    def _work(self, stage: Stage, inbox: queue.Queue, outbox: Optional[queue.Queue]) -> None:
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                return
+
+            start = time.perf_counter()
+            try:
+                result = stage.func(item)
+            except Exception as e:
+                print(f"Error in stage {stage.name}: {e}")
+                result = None
+                with stage._lock:
+                    stage.errors += 1
+            elapsed = time.perf_counter() - start
+
+            blocked = 0.0
+            if result is not None and outbox is not None:
+                start = time.perf_counter()
+                outbox.put(result)
+                blocked = time.perf_counter() - start
+
+            with stage._lock:
+                stage.busy_time += elapsed
+                stage.blocked_time += blocked
+                stage.processed += 1
+                if result is None:
+                    stage.dropped += 1
+
+    def run(self, items: Iterable) -> None:
+        # Counters describe the latest run only
+        for stage in self.stages:
+            stage.reset()
+        self.wall_time = 0.0
+        self.source_blocked_time = 0.0
+        self.source_items = 0
+
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        threads = []
+        for index, stage in enumerate(self.stages):
+            outbox = queues[index + 1] if index + 1 < len(self.stages) else None
+            stage_threads = [threading.Thread(target=self._work, args=(stage, queues[index], outbox),
+                                              name=f"{stage.name}-{n}", daemon=True)
+                             for n in range(stage.workers)]
+            for thread in stage_threads:
+                thread.start()
+            threads.append(stage_threads)
+
+        start = time.perf_counter()
+        try:
+            # The caller's thread is the source; it blocks too when the first queue is full
+            for item in items:
+                put_start = time.perf_counter()
+                queues[0].put(item)
+                self.source_blocked_time += time.perf_counter() - put_start
+                self.source_items += 1
+        finally:
+            # Also runs when the source raises, so no worker is left waiting for input.
+            # Stages shut down in order so every item drains before the next stage stops.
+            for index, stage in enumerate(self.stages):
+                for _ in range(stage.workers):
+                    queues[index].put(_DONE)
+                for thread in threads[index]:
+                    thread.join()
+            self.wall_time = time.perf_counter() - start
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            stage.name: {
+                'workers': stage.workers,
+                'processed': stage.processed,
+                'dropped': stage.dropped,
+                'errors': stage.errors,
+                'busy_time': stage.busy_time,
+                'blocked_time': stage.blocked_time,
+                'utilization': stage.utilization(self.wall_time)
+            }
+            for stage in self.stages
+        }
+
+    def report(self) -> str:
+        lines = ["Stage utilization:"]
+        for stage in self.stages:
+            lines.append(f"- {stage.name} (x{stage.workers}): {stage.processed} items ({stage.dropped} dropped), "
+                         f"{stage.utilization(self.wall_time) * 100:.1f}% busy, "
+                         f"{stage.blocked_time:.2f}s blocked downstream, {stage.errors} errors")
+        lines.append(f"Source: {self.source_items} items, {self.source_blocked_time:.2f}s blocked")
+        lines.append(f"Wall time: {self.wall_time:.2f}s")
+        return '\n'.join(lines)
@@ -2,7 +2,7 @@ import re
 import spacy
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+from src.models.tokenizer import tokenize
 
 # Download required NLTK data
 nltk.download('punkt')
@@ -12,6 +12,83 @@ nltk.download('averaged_perceptron_tagger')
 # Load spaCy model
 nlp = spacy.load('en_core_web_sm')
 
+STOP_WORDS = frozenset(stopwords.words('english'))
+
+# Pipeline components each function can run without
+LEMMA_DISABLE = [name for name in ('parser', 'ner', 'lemmatizer') if name in nlp.pipe_names]
+SKILL_DISABLE = [name for name in ('lemmatizer',) if name in nlp.pipe_names]
+KEYWORD_DISABLE = list(nlp.pipe_names)
+
+DEFAULT_BATCH_SIZE = 256
+LEMMA_CACHE_SIZE = 100000
+
+_lemmatizer = nlp.get_pipe('lemmatizer') if 'lemmatizer' in nlp.pipe_names else None
+_lemma_cache = {}
+
+def _clean_tokens(text):
+    # Convert to lowercase
+    text = text.lower()
+    
+    # Remove special characters and digits
+    text = re.sub(r'[^a-zA-Z\s]', ' ', text)
+    
+    # Remove extra whitespace
+    text = re.sub(r'\s+', ' ', text).strip()
+    
+    # Tokenize and remove stopwords
+    return ' '.join(tokenize(text, STOP_WORDS))
+
+def _lemma(token):
+    # Lemmas set upstream (e.g. by the attribute ruler) take precedence
+    if _lemmatizer is None or token.lemma != 0:
+        return token.lemma_
+    
+    key = (token.text, token.pos_)
+    lemma = _lemma_cache.get(key)
+    if lemma is None:
+        lemma = _lemmatizer.lemmatize(token)[0]
+        if len(_lemma_cache) >= LEMMA_CACHE_SIZE:
+            _lemma_cache.clear()
+        _lemma_cache[key] = lemma
+    return lemma
+
+def _lemmatized_text(doc):
+    return ' '.join(_lemma(token) for token in doc)
+
+def _skills_from_doc(doc):
+    # Extract noun phrases and named entities as potential skills
+    skills = []
+    
+    # Add noun phrases
+    for chunk in doc.noun_chunks:
+        if len(chunk.text.split()) <= 3:  # Limit to phrases of 3 words or less
+            skills.append(chunk.text.lower())
+    
+    # Add named entities
+    for ent in doc.ents:
+        if ent.label_ in ['ORG', 'PRODUCT', 'TECH']:
+            skills.append(ent.text.lower())
+    
+    # Remove duplicates and sort
+    skills = list(set(skills))
+    skills.sort()
+    
+    return skills
+
+def _keywords_from_doc(doc, top_n):
+    # Count word frequencies
+    word_freq = {}
+    for token in doc:
+        if not token.is_stop and not token.is_punct and token.is_alpha:
+            word = token.text.lower()
+            word_freq[word] = word_freq.get(word, 0) + 1
+    
+    # Sort by frequency
+    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+    
+    # Return top N words
+    return [word for word, _ in sorted_words[:top_n]]
+
 def preprocess_text(text):
     """
     Preprocess text by removing special characters, converting to lowercase,
@@ -26,27 +103,24 @@ def preprocess_text(text):
     if not text:
         return ""
     
-    # Convert to lowercase
-    text = text.lower()
-    
-    # Remove special characters and digits
-    text = re.sub(r'[^a-zA-Z\s]', ' ', text)
-    
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Tokenize
-    tokens = word_tokenize(text)
-    
-    # Remove stopwords
-    stop_words = set(stopwords.words('english'))
-    tokens = [token for token in tokens if token not in stop_words]
-    
-    # Lemmatize
-    doc = nlp(' '.join(tokens))
-    lemmatized_tokens = [token.lemma_ for token in doc]
+    doc = nlp(_clean_tokens(text), disable=LEMMA_DISABLE)
+    return _lemmatized_text(doc)
+
+def preprocess_batch(texts, batch_size=DEFAULT_BATCH_SIZE, n_process=1):
+    """
+    Preprocess many texts by streaming them through spaCy in batches.
     
-    return ' '.join(lemmatized_tokens)
+    Args:
+        texts (iterable): Input texts to preprocess
+        batch_size (int): Number of documents per spaCy batch
+        n_process (int): Number of worker processes for spaCy
+        
+    Yields:
+        str: Preprocessed text for each input, in order
+    """
+    cleaned = (_clean_tokens(text) if text else "" for text in texts)
+    for doc in nlp.pipe(cleaned, batch_size=batch_size, n_process=n_process, disable=LEMMA_DISABLE):
+        yield _lemmatized_text(doc)
 
 def extract_skills(text):
     """
@@ -61,27 +135,24 @@ def extract_skills(text):
     if not text:
         return []
     
-    # Process text with spaCy
-    doc = nlp(text)
-    
-    # Extract noun phrases and named entities as potential skills
-    skills = []
-    
-    # Add noun phrases
-    for chunk in doc.noun_chunks:
-        if len(chunk.text.split()) <= 3:  # Limit to phrases of 3 words or less
-            skills.append(chunk.text.lower())
-    
-    # Add named entities
-    for ent in doc.ents:
-        if ent.label_ in ['ORG', 'PRODUCT', 'TECH']:
-            skills.append(ent.text.lower())
-    
-    # Remove duplicates and sort
-    skills = list(set(skills))
-    skills.sort()
+    return _skills_from_doc(nlp(text, disable=SKILL_DISABLE))
+
+def extract_skills_batch(texts, batch_size=DEFAULT_BATCH_SIZE, n_process=1):
+    """
+    Extract skills from many texts by streaming them through spaCy in batches.
     
-    return skills
+    Args:
+        texts (iterable): Input texts to extract skills from
+        batch_size (int): Number of documents per spaCy batch
+        n_process (int): Number of worker processes for spaCy
+        
+    Yields:
+        list: List of extracted skills for each input, in order
+    """
+    docs = nlp.pipe((text or "" for text in texts), batch_size=batch_size,
+                    n_process=n_process, disable=SKILL_DISABLE)
+    for doc in docs:
+        yield _skills_from_doc(doc)
 
 def extract_keywords(text, top_n=10):
     """
@@ -97,18 +168,23 @@ def extract_keywords(text, top_n=10):
     if not text:
         return []
     
-    # Process text with spaCy
-    doc = nlp(text)
-    
-    # Count word frequencies
-    word_freq = {}
-    for token in doc:
-        if not token.is_stop and not token.is_punct and token.is_alpha:
-            word = token.text.lower()
-            word_freq[word] = word_freq.get(word, 0) + 1
-    
-    # Sort by frequency
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+    # Only lexical attributes are needed, so skip the statistical components
+    return _keywords_from_doc(nlp(text, disable=KEYWORD_DISABLE), top_n)
+
+def extract_keywords_batch(texts, top_n=10, batch_size=DEFAULT_BATCH_SIZE, n_process=1):
+    """
+    Extract keywords from many texts by streaming them through spaCy in batches.
     
-    # Return top N words
-    return [word for word, _ in sorted_words[:top_n]] 
\ No newline at end of file
+    Args:
+        texts (iterable): Input texts to extract keywords from
+        top_n (int): Number of top keywords to extract per text
+        batch_size (int): Number of documents per spaCy batch
+        n_process (int): Number of worker processes for spaCy
+        
+    Yields:
+        list: List of extracted keywords for each input, in order
+    """
+    docs = nlp.pipe((text or "" for text in texts), batch_size=batch_size,
+                    n_process=n_process, disable=KEYWORD_DISABLE)
+    for doc in docs:
+        yield _keywords_from_doc(doc, top_n)
\ No newline at end of file
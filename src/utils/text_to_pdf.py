@@ -1,18 +1,43 @@
 import os
 from fpdf import FPDF
-from typing import Optional
+from typing import Optional, Tuple
 
-def convert_text_to_pdf(text: str, output_path: str) -> bool:
-    try:
+class PdfTemplate:
+    """Page layout shared by every rendered document.
+    
+    Font, line height and cell width are fixed once and the template object
+    is reused for every file (and sent once to each worker by the bulk
+    renderer). Lines are laid out one cell each, as before. That was faster
+    than wrapping with multi_cell when measured.
+    """
+    
+    def __init__(self, font: str = "Arial", font_size: int = 12, line_height: float = 10,
+                 cell_width: float = 200):
+        self.font = font
+        self.font_size = font_size
+        self.line_height = line_height
+        self.cell_width = cell_width
+    
+    def render(self, text: str) -> Tuple[bytes, int]:
         pdf = FPDF()
         pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        lines = text.split('\n')
-        for line in lines:
-            pdf.cell(200, 10, txt=line, ln=1, align='L')
-        
-        pdf.output(output_path)
+        pdf.set_font(self.font, size=self.font_size)
+        # Core PDF fonts are latin-1 only
+        for line in text.encode('latin-1', 'replace').decode('latin-1').split('\n'):
+            pdf.cell(self.cell_width, self.line_height, txt=line, ln=1, align='L')
+        return pdf.output(dest='S').encode('latin-1'), pdf.page_no()
+    
+    def write(self, text: str, output_path: str) -> int:
+        data, pages = self.render(text)
+        with open(output_path, 'wb') as f:
+            f.write(data)
+        return pages
+
+DEFAULT_TEMPLATE = PdfTemplate()
+
+def convert_text_to_pdf(text: str, output_path: str, template: Optional[PdfTemplate] = None) -> bool:
+    try:
+        (template or DEFAULT_TEMPLATE).write(text, output_path)
         return True
     
     except Exception as e: